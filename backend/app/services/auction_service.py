@@ -121,7 +121,14 @@ def calculate_surplus_value(
     df = player_values.copy()
 
     if expected_costs:
-        df["expected_cost"] = df["player_id"].map(expected_costs).fillna(1.0)
+        # Build the cost lookup as one indexed array and align it with a single reindex
+        cost_lookup = pd.Series(
+            np.array(list(expected_costs.values()), dtype=np.float64),
+            index=np.fromiter(expected_costs.keys(), dtype=np.int64, count=len(expected_costs)),
+        )
+        df["expected_cost"] = (
+            cost_lookup.reindex(df["player_id"].to_numpy()).fillna(1.0).to_numpy()
+        )
     else:
         # Estimate cost from value ranking (top players cost more than their value)
         df = df.sort_values("auction_value", ascending=False).reset_index(drop=True)
@@ -149,48 +156,48 @@ def calculate_dynasty_value(
         DataFrame with dynasty_value (0-100) and keep_cut_horizon columns.
     """
     df = player_values.copy()
-
-    dynasty_scores = []
-    keep_cut_horizons = []
-
-    for _, row in df.iterrows():
-        pid = row["player_id"]
-        age = player_ages.get(pid, 30)
-        yoc = (years_of_control or {}).get(pid, max(0, 38 - age))  # Estimate if unknown
-        annual_value = row.get("auction_value", 0)
-        current_cost = row.get("expected_cost", 1)
-
-        # Multi-year value with aging discount
-        total_future_value = 0.0
-        keep_cut = 0
-        for year in range(yoc):
-            future_age = age + year
-            # Decline rate: 2% per year after peak, accelerating after 32
-            if future_age <= 27:
-                age_factor = 1.0 + 0.01 * (27 - future_age)  # Slight growth pre-peak
-            elif future_age <= 32:
-                age_factor = 1.0 - 0.02 * (future_age - 27)
-            else:
-                age_factor = max(0.3, 1.0 - 0.02 * 5 - 0.04 * (future_age - 32))
-
-            projected_year_value = annual_value * age_factor
-            keeper_cost = current_cost + (keeper_cost_inflation * year)
-
-            # Discount future value by uncertainty (further out = less certain)
-            uncertainty_discount = 0.9 ** year
-            discounted_value = projected_year_value * uncertainty_discount
-
-            total_future_value += max(0, discounted_value)
-
-            # Track when cost exceeds value
-            if keeper_cost < projected_year_value and keep_cut == year:
-                keep_cut = year + 1
-
-        dynasty_scores.append(total_future_value)
-        keep_cut_horizons.append(keep_cut)
-
-    df["dynasty_raw"] = dynasty_scores
-    df["keep_cut_horizon"] = keep_cut_horizons
+    control = years_of_control or {}
+
+    # Per-player inputs as arrays; the year loop below runs across all players at once
+    player_ids = df["player_id"].tolist()
+    ages = np.array([player_ages.get(pid, 30) for pid in player_ids], dtype=np.int64)
+    yoc = np.array(
+        [control.get(pid, max(0, 38 - age)) for pid, age in zip(player_ids, ages.tolist())],
+        dtype=np.int64,
+    )  # Estimate if unknown
+    annual_value = _column_or(df, "auction_value", 0.0)
+    current_cost = _column_or(df, "expected_cost", 1.0)
+
+    # Multi-year value with aging discount
+    total_future_value = np.zeros(len(df))
+    keep_cut = np.zeros(len(df), dtype=np.int64)
+    for year in range(int(yoc.max(initial=0))):
+        active = year < yoc
+        future_age = ages + year
+        # Decline rate: 2% per year after peak, accelerating after 32
+        age_factor = np.select(
+            [future_age <= 27, future_age <= 32],
+            [
+                1.0 + 0.01 * (27 - future_age),  # Slight growth pre-peak
+                1.0 - 0.02 * (future_age - 27),
+            ],
+            default=np.maximum(0.3, 1.0 - 0.02 * 5 - 0.04 * (future_age - 32)),
+        )
+
+        projected_year_value = annual_value * age_factor
+        keeper_cost = current_cost + (keeper_cost_inflation * year)
+
+        # Discount future value by uncertainty (further out = less certain)
+        uncertainty_discount = 0.9 ** year
+        discounted_value = projected_year_value * uncertainty_discount
+
+        total_future_value += np.where(active & (discounted_value > 0), discounted_value, 0.0)
+
+        # Track when cost exceeds value
+        keep_cut += active & (keeper_cost < projected_year_value) & (keep_cut == year)
+
+    df["dynasty_raw"] = total_future_value
+    df["keep_cut_horizon"] = keep_cut
 
     # Normalize dynasty_raw to 0-100 scale
     max_val = df["dynasty_raw"].max()
@@ -210,33 +217,45 @@ def _calculate_category_sgp(
     categories: list[str],
     sgp_denominators: dict[str, float],
 ) -> pd.DataFrame:
-    """Calculate raw SGP value for each player across all categories."""
-    df = projections.copy()
-    df["sgp_total"] = 0.0
-
-    for cat in categories:
-        if cat not in df.columns or cat not in sgp_denominators:
-            continue
-        sgp_denom = sgp_denominators[cat]
-        if sgp_denom == 0:
-            continue
-
-        # For negative SGP stats (ERA, WHIP), lower is better
-        # The replacement level is roughly the value at the Nth ranked player
-        col_values = df[cat].fillna(0)
-
-        if sgp_denom < 0:
-            # Lower is better: value = (replacement - player) / |sgp|
-            replacement = col_values.quantile(0.75)
-            df[f"sgp_{cat}"] = (replacement - col_values) / abs(sgp_denom)
-        else:
-            # Higher is better: value = (player - replacement) / sgp
-            replacement = col_values.quantile(0.25)
-            df[f"sgp_{cat}"] = (col_values - replacement) / sgp_denom
-
-        df["sgp_total"] += df[f"sgp_{cat}"]
+    """Calculate raw SGP value for each player across all categories.
 
-    return df
+    All scored categories are evaluated together as one (players x categories)
+    matrix: one quantile call for the replacement levels, one subtraction and
+    one division for the per-category SGP.
+    """
+    cats = [
+        cat for cat in categories
+        if cat in projections.columns and sgp_denominators.get(cat, 0) != 0
+    ]
+    denoms = np.array([sgp_denominators[cat] for cat in cats], dtype=float)
+    lower_is_better = denoms < 0
+
+    values = projections[cats].fillna(0).to_numpy(dtype=float)
+
+    # The replacement level is roughly the value at the Nth ranked player:
+    # 75th percentile for lower-is-better stats (ERA, WHIP), 25th otherwise
+    if len(values):
+        replacement = np.where(
+            lower_is_better,
+            np.quantile(values, 0.75, axis=0),
+            np.quantile(values, 0.25, axis=0),
+        )
+    else:
+        replacement = np.full(len(cats), np.nan)
+
+    # Lower is better: (replacement - player) / |sgp|
+    # Higher is better: (player - replacement) / sgp
+    above_replacement = np.where(lower_is_better, replacement - values, values - replacement)
+    cat_sgp = above_replacement / np.abs(denoms)
+
+    # Accumulate category by category so totals match a running sum
+    sgp_total = np.zeros(len(values))
+    for j in range(len(cats)):
+        sgp_total += cat_sgp[:, j]
+
+    columns = {"sgp_total": sgp_total}
+    columns.update({f"sgp_{cat}": cat_sgp[:, j] for j, cat in enumerate(cats)})
+    return projections.assign(**columns)
 
 
 def _scale_to_dollars(
@@ -245,36 +264,37 @@ def _scale_to_dollars(
     total_roster_slots: int,
 ) -> pd.DataFrame:
     """Scale SGP values to auction dollar amounts."""
-    df = sgp_df.copy()
-
     # Only price the top N players (roster slots)
-    df = df.sort_values("sgp_total", ascending=False).reset_index(drop=True)
+    df = sgp_df.sort_values("sgp_total", ascending=False).reset_index(drop=True)
+    sgp_total = df["sgp_total"].to_numpy(dtype=float)
 
     # Replacement level is the last rostered player
-    if len(df) > total_roster_slots:
-        replacement_sgp = df.iloc[total_roster_slots]["sgp_total"]
-    else:
-        replacement_sgp = 0
+    replacement_sgp = sgp_total[total_roster_slots] if len(df) > total_roster_slots else 0
 
     # Value above replacement
-    df["var"] = df["sgp_total"] - replacement_sgp
-    df["var"] = df["var"].clip(lower=0)
+    var = np.maximum(sgp_total - replacement_sgp, 0)
+    df["var"] = var
 
     # Convert to dollars
-    total_var = df["var"].sum()
-    # Reserve $1 per roster slot as minimum bid
+    total_var = var.sum()
+    # Reserve $1 per roster slot as minimum bid; players below replacement get $1
     distributable = total_dollars - total_roster_slots
     if total_var > 0:
-        df["auction_value"] = ((df["var"] / total_var) * distributable + 1).round(1)
+        dollars = np.round((var / total_var) * distributable + 1, 1)
+        df["auction_value"] = np.where(var > 0, dollars, 1.0)
     else:
         df["auction_value"] = 1.0
 
-    # Players below replacement get $1
-    df.loc[df["var"] <= 0, "auction_value"] = 1.0
-
     return df
 
 
+def _column_or(df: pd.DataFrame, col: str, default: float) -> np.ndarray:
+    """Column values as a float array, or a constant array if the column is absent."""
+    if col not in df.columns:
+        return np.full(len(df), default)
+    return df[col].to_numpy(dtype=float)
+
+
 def _cost_multiplier(ranks: pd.Index, total: int) -> pd.Series:
     """Estimate cost multiplier by rank (top players are overpaid relative to value)."""
     pct = ranks / max(total, 1)
@@ -15,6 +15,11 @@ logger = logging.getLogger(__name__)
 BATTER_PEAK_AGE = 27
 PITCHER_PEAK_AGE = 26
 
+# League-average baselines for luck differentials
+LEAGUE_BABIP = 0.296
+LEAGUE_LOB_PCT = 0.72
+LEAGUE_HR_FB_PCT = 0.132
+
 
 def engineer_batting_features(batting_df: pd.DataFrame, player_ages: dict[int, int]) -> pd.DataFrame:
     """Build ML-ready feature matrix from multi-season batting data.
@@ -29,52 +34,46 @@ def engineer_batting_features(batting_df: pd.DataFrame, player_ages: dict[int, i
     if batting_df.empty:
         return pd.DataFrame()
 
-    features = []
-    for player_id, group in batting_df.groupby("player_id"):
-        seasons = group.sort_values("season", ascending=False)
-        age = player_ages.get(player_id)
-        if age is None or len(seasons) == 0:
-            continue
-
-        latest = seasons.iloc[0]
-        row = {"player_id": player_id}
-
-        # --- Differential features (actual vs. expected) ---
-        row["woba_minus_xwoba"] = _safe_diff(latest, "woba", "xwoba")
-        row["ba_minus_xba"] = _safe_diff(latest, "avg", "xba")
-        row["slg_minus_xslg"] = _safe_diff(latest, "slg", "xslg")
-        row["babip_minus_league"] = _safe_sub(latest.get("babip"), 0.296)
-
-        # --- Year-over-year delta features ---
-        yoy_stats = [
-            "barrel_pct", "hard_hit_pct", "k_pct", "bb_pct", "avg_exit_velocity",
-            "woba", "xwoba", "iso", "wrc_plus", "sprint_speed",
-        ]
-        for stat in yoy_stats:
-            row[f"{stat}_yoy_delta"] = _yoy_delta(seasons, stat)
-            row[f"{stat}_2yr_trend"] = _multi_year_trend_slope(seasons, stat, n=2)
-            row[f"{stat}_3yr_trend"] = _multi_year_trend_slope(seasons, stat, n=3)
-
-        # --- Age curve features ---
-        row["age"] = age
-        row["years_from_peak"] = age - BATTER_PEAK_AGE
-        row["age_bucket"] = _age_bucket(age, BATTER_PEAK_AGE)
-        row["pre_peak"] = 1 if age < BATTER_PEAK_AGE else 0
-
-        # --- Playing time trend ---
-        row["pa_yoy_delta"] = _yoy_delta(seasons, "pa")
-        row["pa_latest"] = latest.get("pa", 0) or 0
-
-        # --- Latest stats as features ---
-        for stat in ["barrel_pct", "hard_hit_pct", "k_pct", "bb_pct",
-                      "avg_exit_velocity", "sprint_speed", "woba", "xwoba",
-                      "iso", "babip", "war", "gb_pct", "fb_pct", "ld_pct"]:
-            row[f"latest_{stat}"] = latest.get(stat)
-
-        row["seasons_available"] = len(seasons)
-        features.append(row)
-
-    result = pd.DataFrame(features)
+    seasons, latest, ages = _latest_seasons(_downcast(batting_df), player_ages)
+    if latest.empty:
+        return pd.DataFrame()
+
+    # --- Differential features (actual vs. expected) ---
+    features = {
+        "woba_minus_xwoba": _safe_diff(latest, "woba", "xwoba"),
+        "ba_minus_xba": _safe_diff(latest, "avg", "xba"),
+        "slg_minus_xslg": _safe_diff(latest, "slg", "xslg"),
+        "babip_minus_league": _safe_sub(latest, "babip", LEAGUE_BABIP),
+    }
+
+    # --- Year-over-year delta features ---
+    yoy_stats = [
+        "barrel_pct", "hard_hit_pct", "k_pct", "bb_pct", "avg_exit_velocity",
+        "woba", "xwoba", "iso", "wrc_plus", "sprint_speed",
+    ]
+    history = _recent_values(seasons, yoy_stats + ["pa"])
+    for stat in yoy_stats:
+        features.update(_trend_features(history, stat, latest.index))
+
+    # --- Age curve features ---
+    features["age"] = ages
+    features["years_from_peak"] = ages - BATTER_PEAK_AGE
+    features["age_bucket"] = _age_bucket(ages, BATTER_PEAK_AGE)
+    features["pre_peak"] = (ages < BATTER_PEAK_AGE).astype(int)
+
+    # --- Playing time trend ---
+    features["pa_yoy_delta"] = _yoy_delta(history, "pa", latest.index)
+    features["pa_latest"] = _latest_or_zero(latest, "pa")
+
+    # --- Latest stats as features ---
+    for stat in ["barrel_pct", "hard_hit_pct", "k_pct", "bb_pct",
+                  "avg_exit_velocity", "sprint_speed", "woba", "xwoba",
+                  "iso", "babip", "war", "gb_pct", "fb_pct", "ld_pct"]:
+        features[f"latest_{stat}"] = latest.get(stat)
+
+    features["seasons_available"] = seasons.groupby("player_id").size()
+
+    result = pd.DataFrame(features, index=latest.index).reset_index()
     logger.info(f"Engineered {len(result)} batter feature rows with {len(result.columns)} features")
     return result
 
@@ -94,57 +93,54 @@ def engineer_pitching_features(
     if pitching_df.empty:
         return pd.DataFrame()
 
-    features = []
-    for player_id, group in pitching_df.groupby("player_id"):
-        seasons = group.sort_values("season", ascending=False)
-        age = player_ages.get(player_id)
-        if age is None or len(seasons) == 0:
-            continue
-
-        latest = seasons.iloc[0]
-        row = {"player_id": player_id}
-
-        # --- Differential features ---
-        row["era_minus_fip"] = _safe_diff(latest, "era", "fip")
-        row["era_minus_xera"] = _safe_diff(latest, "era", "xera")
-        row["fip_minus_xfip"] = _safe_diff(latest, "fip", "xfip")
-        row["babip_minus_league"] = _safe_sub(latest.get("babip"), 0.296)
-        row["lob_pct_minus_league"] = _safe_sub(latest.get("lob_pct"), 0.72)
-        row["hr_fb_pct_minus_league"] = _safe_sub(latest.get("hr_fb_pct"), 0.132)
-
-        # --- Year-over-year delta features ---
-        yoy_stats = [
-            "k_pct", "bb_pct", "k_bb_pct", "swstr_pct", "csw_pct",
-            "barrel_pct_against", "hard_hit_pct_against", "gb_pct",
-            "era", "fip", "siera", "whip",
-        ]
-        for stat in yoy_stats:
-            row[f"{stat}_yoy_delta"] = _yoy_delta(seasons, stat)
-            row[f"{stat}_2yr_trend"] = _multi_year_trend_slope(seasons, stat, n=2)
-            row[f"{stat}_3yr_trend"] = _multi_year_trend_slope(seasons, stat, n=3)
-
-        # --- Age curve features ---
-        row["age"] = age
-        row["years_from_peak"] = age - PITCHER_PEAK_AGE
-        row["age_bucket"] = _age_bucket(age, PITCHER_PEAK_AGE)
-        row["pre_peak"] = 1 if age < PITCHER_PEAK_AGE else 0
-
-        # --- Role features ---
-        row["is_starter"] = 1 if (latest.get("gs", 0) or 0) > 5 else 0
-        row["ip_latest"] = latest.get("ip", 0) or 0
-        row["ip_yoy_delta"] = _yoy_delta(seasons, "ip")
-
-        # --- Latest stats ---
-        for stat in ["k_pct", "bb_pct", "k_bb_pct", "swstr_pct", "csw_pct",
-                      "era", "fip", "xfip", "siera", "whip", "war",
-                      "barrel_pct_against", "hard_hit_pct_against",
-                      "gb_pct", "lob_pct", "hr_fb_pct", "stuff_plus", "xera"]:
-            row[f"latest_{stat}"] = latest.get(stat)
-
-        row["seasons_available"] = len(seasons)
-        features.append(row)
-
-    result = pd.DataFrame(features)
+    seasons, latest, ages = _latest_seasons(_downcast(pitching_df), player_ages)
+    if latest.empty:
+        return pd.DataFrame()
+
+    # --- Differential features ---
+    features = {
+        "era_minus_fip": _safe_diff(latest, "era", "fip"),
+        "era_minus_xera": _safe_diff(latest, "era", "xera"),
+        "fip_minus_xfip": _safe_diff(latest, "fip", "xfip"),
+        "babip_minus_league": _safe_sub(latest, "babip", LEAGUE_BABIP),
+        "lob_pct_minus_league": _safe_sub(latest, "lob_pct", LEAGUE_LOB_PCT),
+        "hr_fb_pct_minus_league": _safe_sub(latest, "hr_fb_pct", LEAGUE_HR_FB_PCT),
+    }
+
+    # --- Year-over-year delta features ---
+    yoy_stats = [
+        "k_pct", "bb_pct", "k_bb_pct", "swstr_pct", "csw_pct",
+        "barrel_pct_against", "hard_hit_pct_against", "gb_pct",
+        "era", "fip", "siera", "whip",
+    ]
+    history = _recent_values(seasons, yoy_stats + ["ip"])
+    for stat in yoy_stats:
+        features.update(_trend_features(history, stat, latest.index))
+
+    # --- Age curve features ---
+    features["age"] = ages
+    features["years_from_peak"] = ages - PITCHER_PEAK_AGE
+    features["age_bucket"] = _age_bucket(ages, PITCHER_PEAK_AGE)
+    features["pre_peak"] = (ages < PITCHER_PEAK_AGE).astype(int)
+
+    # --- Role features ---
+    if "gs" in latest.columns:
+        features["is_starter"] = (latest["gs"].fillna(0) > 5).astype(int)
+    else:
+        features["is_starter"] = 0
+    features["ip_latest"] = _latest_or_zero(latest, "ip")
+    features["ip_yoy_delta"] = _yoy_delta(history, "ip", latest.index)
+
+    # --- Latest stats ---
+    for stat in ["k_pct", "bb_pct", "k_bb_pct", "swstr_pct", "csw_pct",
+                  "era", "fip", "xfip", "siera", "whip", "war",
+                  "barrel_pct_against", "hard_hit_pct_against",
+                  "gb_pct", "lob_pct", "hr_fb_pct", "stuff_plus", "xera"]:
+        features[f"latest_{stat}"] = latest.get(stat)
+
+    features["seasons_available"] = seasons.groupby("player_id").size()
+
+    result = pd.DataFrame(features, index=latest.index).reset_index()
     logger.info(
         f"Engineered {len(result)} pitcher feature rows with {len(result.columns)} features"
     )
@@ -154,59 +150,139 @@ def engineer_pitching_features(
 # ---- Helper functions ----
 
 
-def _safe_diff(row, col_a: str, col_b: str) -> float | None:
-    """Compute row[col_a] - row[col_b], returning None if either is missing."""
-    a = row.get(col_a) if isinstance(row, dict) else getattr(row, col_a, None)
-    b = row.get(col_b) if isinstance(row, dict) else getattr(row, col_b, None)
-    if a is not None and b is not None and not (np.isnan(a) or np.isnan(b)):
-        return float(a - b)
-    return None
+def _downcast(df: pd.DataFrame) -> pd.DataFrame:
+    """Copy of df with float64 columns narrowed to float32.
 
+    Rate stats carry at most four significant digits, so float32 loses nothing
+    meaningful and halves the bytes the column arithmetic below streams through.
+    """
+    float_cols = df.select_dtypes("float64").columns
+    return df.astype(dict.fromkeys(float_cols, np.float32))
 
-def _safe_sub(val, baseline: float) -> float | None:
-    """Subtract a baseline from a value, returning None if val is missing."""
-    if val is not None and not (isinstance(val, float) and np.isnan(val)):
-        return float(val - baseline)
-    return None
 
+def _latest_seasons(
+    df: pd.DataFrame, player_ages: dict[int, int]
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.Series]:
+    """Order seasons for players with a known age and pick each one's latest season.
 
-def _yoy_delta(seasons: pd.DataFrame, stat: str) -> float | None:
-    """Compute most-recent minus previous season for a stat."""
-    vals = seasons[stat].dropna() if stat in seasons.columns else pd.Series(dtype=float)
-    if len(vals) < 2:
-        return None
-    return float(vals.iloc[0] - vals.iloc[1])
+    Returns:
+        (seasons sorted by player_id then most recent season first,
+         latest season per player indexed by player_id,
+         current age per player aligned with the latest frame).
+    """
+    seasons = df.sort_values(["player_id", "season"], ascending=[True, False], kind="stable")
+    seasons = seasons[seasons["player_id"].map(player_ages).notna()]
+    latest = seasons.groupby("player_id").head(1).set_index("player_id")
+    ages = latest.index.to_series().map(player_ages)
+    return seasons, latest, ages
 
 
-def _multi_year_trend_slope(seasons: pd.DataFrame, stat: str, n: int = 3) -> float | None:
-    """Fit a linear regression slope across up to n seasons.
+def _latest_or_zero(latest: pd.DataFrame, col: str) -> pd.Series | int:
+    """Latest-season values of a column, or 0 when the column is absent."""
+    if col not in latest.columns:
+        return 0
+    return latest[col]
+
 
-    Returns the slope (per-season change rate) or None if insufficient data.
-    Seasons are ordered most recent first, so we reverse for regression.
+def _safe_diff(df: pd.DataFrame, col_a: str, col_b: str) -> pd.Series | None:
+    """Compute df[col_a] - df[col_b] column-wise; NaN where either value is missing.
+
+    Returns None if either column is absent.
     """
-    if stat not in seasons.columns:
+    if col_a not in df.columns or col_b not in df.columns:
         return None
-    vals = seasons[stat].dropna().head(n)
-    if len(vals) < 2:
+    return df[col_a] - df[col_b]
+
+
+def _safe_sub(df: pd.DataFrame, col: str, baseline: float) -> pd.Series | None:
+    """Subtract a baseline from a column, returning None if the column is absent."""
+    if col not in df.columns:
         return None
-    # Reverse so x=0 is oldest, x=n-1 is most recent
-    y = vals.values[::-1].astype(float)
-    x = np.arange(len(y), dtype=float)
-    # Simple least squares
-    try:
-        slope = np.polyfit(x, y, 1)[0]
-        return float(slope)
-    except (np.linalg.LinAlgError, ValueError):
+    return df[col] - baseline
+
+
+def _recent_values(
+    seasons: pd.DataFrame, stats: list[str], depth: int = 3
+) -> dict[str, np.ndarray]:
+    """Each player's most recent non-null values per stat, as (players, depth) arrays.
+
+    Seasons must be ordered by player, most recent first. player_id is factorized
+    once into dense codes (in the same sorted order as the latest-season index)
+    and every stat is ranked with array ops rather than a groupby per stat.
+    Slot 0 is the latest non-null value; unused slots are NaN. Stats missing
+    from the frame are left out of the result.
+    """
+    codes, player_ids = pd.factorize(seasons["player_id"], sort=True)
+    present = [stat for stat in stats if stat in seasons.columns]
+    values = seasons[present].to_numpy(dtype=np.float32)
+    has_value = ~np.isnan(values)
+
+    # Recency rank among a player's non-null values: the running count of
+    # non-null values minus what was carried in from earlier players
+    running = np.cumsum(has_value, axis=0)
+    group_start = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    carried = (running - has_value)[group_start]
+    rank = running - 1 - carried[codes]
+
+    rows, cols = np.nonzero(has_value & (rank < depth))
+    recent = np.full((len(player_ids), len(present), depth), np.nan, dtype=np.float32)
+    recent[codes[rows], cols, rank[rows, cols]] = values[rows, cols]
+    return {stat: recent[:, j] for j, stat in enumerate(present)}
+
+
+def _trend_features(
+    history: dict[str, np.ndarray], stat: str, index: pd.Index
+) -> dict[str, pd.Series | None]:
+    """YoY delta plus 2- and 3-season trend slopes of a stat for every player."""
+    return {
+        f"{stat}_yoy_delta": _yoy_delta(history, stat, index),
+        f"{stat}_2yr_trend": _multi_year_trend_slope(history, stat, index, n=2),
+        f"{stat}_3yr_trend": _multi_year_trend_slope(history, stat, index, n=3),
+    }
+
+
+def _yoy_delta(history: dict[str, np.ndarray], stat: str, index: pd.Index) -> pd.Series | None:
+    """Compute most-recent minus previous season for a stat, per player.
+
+    Players with fewer than two non-null values get NaN.
+    """
+    if stat not in history:
         return None
+    recent = history[stat]
+    return pd.Series(recent[:, 0] - recent[:, 1], index=index)
 
 
-def _age_bucket(age: int, peak_age: int) -> int:
-    """Encode age into bucket: 0=pre-peak, 1=peak, 2=early-decline, 3=late-decline."""
-    if age < peak_age:
-        return 0
-    elif age <= peak_age + 2:
-        return 1
-    elif age <= 32:
-        return 2
-    else:
-        return 3
+def _multi_year_trend_slope(
+    history: dict[str, np.ndarray], stat: str, index: pd.Index, n: int = 3
+) -> pd.Series | None:
+    """Fit a linear regression slope across up to n seasons, per player.
+
+    Returns the slope (per-season change rate), NaN where a player has fewer
+    than two non-null values. Values are ordered most recent first, so x
+    counts up from the oldest season in the window; the least-squares slope
+    is evaluated in closed form for all players at once.
+    """
+    if stat not in history:
+        return None
+    y = history[stat][:, :n]
+    valid = ~np.isnan(y)
+    m = valid.sum(axis=1, keepdims=True)
+
+    # Centered x = ((m - 1) - slot) - (m - 1) / 2 for a window of m seasons
+    x = np.where(valid, (m - 1) / 2 - np.arange(y.shape[1]), 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        y_mean = np.nansum(y, axis=1, keepdims=True) / m
+        y_centered = np.where(valid, y - y_mean, 0.0)
+        sxx = (x * x).sum(axis=1)
+        slope = np.where(sxx > 0, (x * y_centered).sum(axis=1) / sxx, np.nan)
+    return pd.Series(slope, index=index)
+
+
+def _age_bucket(ages: pd.Series, peak_age: int) -> pd.Series:
+    """Encode ages into buckets: 0=pre-peak, 1=peak, 2=early-decline, 3=late-decline.
+
+    Peak spans peak_age..peak_age+2 and early decline runs through 32; bins are
+    half-open on the right, which matches those inclusive bounds for whole-year ages.
+    """
+    bins = [peak_age, peak_age + 3, 33]
+    return pd.Series(np.digitize(ages.to_numpy(), bins), index=ages.index)
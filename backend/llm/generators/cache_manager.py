@@ -6,19 +6,72 @@ a player changes teams, or goes on/off the IL.
 """
 
 import logging
+from collections.abc import Sequence
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
 # Thresholds for staleness detection
 SCORE_CHANGE_THRESHOLD = 10.0  # Points of change before marking stale
 DOLLAR_CHANGE_THRESHOLD = 5.0  # Dollar value change threshold
+REGRESSION_FLIP_MIN_CHANGE = 0.02  # Minimum swing for a regression sign flip to count
+SCORE_MAX = 100  # Model scores live on a 0-100 scale
+
+# Tracked field -> maximum allowed absolute change, checked in this order
+_STALENESS_THRESHOLDS = {
+    "sleeper_score": SCORE_CHANGE_THRESHOLD,
+    "bust_score": SCORE_CHANGE_THRESHOLD,
+    "consistency_score": SCORE_CHANGE_THRESHOLD,
+    "improvement_score": SCORE_CHANGE_THRESHOLD,
+    "ai_value_score": SCORE_CHANGE_THRESHOLD,
+    "auction_value": DOLLAR_CHANGE_THRESHOLD,
+    "dynasty_value": DOLLAR_CHANGE_THRESHOLD,
+    "surplus_value": DOLLAR_CHANGE_THRESHOLD,
+}
+_THRESHOLD_KEYS = list(_STALENESS_THRESHOLDS)
+_THRESHOLD_VALUES = np.array(list(_STALENESS_THRESHOLDS.values()))
+
+
+def _build_staleness_check(thresholds: dict[str, float], flip_min_change: float):
+    """Generate is_report_stale as straight-line code with fields and thresholds inlined.
+
+    The tracked fields are fixed at import time, so instead of looping over the
+    threshold dict on every cache lookup we emit one comparison block per field.
+    """
+    lines = [
+        "def is_report_stale(cached_snapshot, current_scores):",
+        "    if cached_snapshot is None:",
+        "        return True",
+        "    old_get = cached_snapshot.get",
+        "    new_get = current_scores.get",
+    ]
+    for key, threshold in thresholds.items():
+        lines += [
+            f"    old_val = old_get({key!r})",
+            f"    new_val = new_get({key!r})",
+            "    if old_val is not None and new_val is not None:",
+            f"        if abs(new_val - old_val) > {threshold!r}:",
+            f'            logger.debug(f"Report stale: {key} changed '
+            '{old_val:.1f} -> {new_val:.1f}")',
+            "            return True",
+        ]
+    lines += [
+        "    old_reg = old_get('regression_direction', 0)",
+        "    new_reg = new_get('regression_direction', 0)",
+        f"    if old_reg * new_reg < 0 and abs(new_reg - old_reg) > {flip_min_change!r}:",
+        "        logger.debug('Report stale: regression direction flipped')",
+        "        return True",
+        "    return False",
+    ]
+    # The source is assembled only from the module-level constants above
+    namespace = {"__name__": __name__, "logger": logger}
+    exec("\n".join(lines), namespace)
+    return namespace["is_report_stale"]
 
 
-def is_report_stale(
-    cached_snapshot: dict | None,
-    current_scores: dict,
-) -> bool:
-    """Determine if a cached report should be marked as stale.
+is_report_stale = _build_staleness_check(_STALENESS_THRESHOLDS, REGRESSION_FLIP_MIN_CHANGE)
+is_report_stale.__doc__ = """Determine if a cached report should be marked as stale.
 
     Args:
         cached_snapshot: The model_scores_snapshot from when the report was generated.
@@ -27,40 +80,40 @@ def is_report_stale(
     Returns:
         True if the report should be regenerated.
     """
-    if cached_snapshot is None:
-        return True
 
-    # Check score-based staleness
-    score_keys = [
-        "sleeper_score", "bust_score", "consistency_score",
-        "improvement_score", "ai_value_score",
-    ]
-    for key in score_keys:
-        old_val = cached_snapshot.get(key)
-        new_val = current_scores.get(key)
-        if old_val is not None and new_val is not None:
-            if abs(new_val - old_val) > SCORE_CHANGE_THRESHOLD:
-                logger.debug(f"Report stale: {key} changed {old_val:.1f} -> {new_val:.1f}")
-                return True
-
-    # Check dollar value staleness
-    dollar_keys = ["auction_value", "dynasty_value", "surplus_value"]
-    for key in dollar_keys:
-        old_val = cached_snapshot.get(key)
-        new_val = current_scores.get(key)
-        if old_val is not None and new_val is not None:
-            if abs(new_val - old_val) > DOLLAR_CHANGE_THRESHOLD:
-                logger.debug(f"Report stale: {key} changed {old_val:.1f} -> {new_val:.1f}")
-                return True
-
-    # Check regression direction flip
-    old_reg = cached_snapshot.get("regression_direction", 0)
-    new_reg = current_scores.get("regression_direction", 0)
-    if old_reg * new_reg < 0 and abs(new_reg - old_reg) > 0.02:
-        logger.debug("Report stale: regression direction flipped")
-        return True
-
-    return False
+
+def is_report_stale_batch(
+    cached_snapshots: Sequence[dict | None],
+    current_scores: Sequence[dict],
+) -> np.ndarray:
+    """Vectorized is_report_stale over many players at once.
+
+    Args:
+        cached_snapshots: Cached model_scores_snapshot per player (None if never generated).
+        current_scores: Current model scores, aligned with cached_snapshots.
+
+    Returns:
+        Boolean array, True where the report should be regenerated.
+    """
+    missing = np.array([snap is None for snap in cached_snapshots], dtype=bool)
+    snapshots = [snap or {} for snap in cached_snapshots]
+
+    old_vals = _stack_fields(snapshots, _THRESHOLD_KEYS)
+    new_vals = _stack_fields(current_scores, _THRESHOLD_KEYS)
+    # Missing values compare as NaN, which never exceeds a threshold
+    changed = (np.abs(new_vals - old_vals) > _THRESHOLD_VALUES).any(axis=1)
+
+    old_reg = _stack_fields(snapshots, ["regression_direction"], default=0)[:, 0]
+    new_reg = _stack_fields(current_scores, ["regression_direction"], default=0)[:, 0]
+    flipped = (old_reg * new_reg < 0) & (np.abs(new_reg - old_reg) > REGRESSION_FLIP_MIN_CHANGE)
+
+    return missing | changed | flipped
+
+
+def _stack_fields(rows: Sequence[dict], keys: list[str], default=None) -> np.ndarray:
+    """Stack dict fields into an (N, len(keys)) float array, None/missing as NaN."""
+    stacked = np.array([[row.get(key, default) for key in keys] for row in rows], dtype=float)
+    return stacked.reshape(len(rows), len(keys))
 
 
 def select_batch_players(
@@ -82,31 +135,28 @@ def select_batch_players(
     """
     player_reports: dict[int, list[str]] = {}
 
-    scores_list = [(pid, s) for pid, s in all_scores.items()]
+    pids = list(all_scores)
+    score_list = list(all_scores.values())
+    value_arr = _score_array(score_list, "ai_value_score")
+    sleeper_arr = _score_array(score_list, "sleeper_score")
+    bust_arr = _score_array(score_list, "bust_score")
 
     # Top players by AI value score get full reports
-    by_value = sorted(scores_list, key=lambda x: x[1].get("ai_value_score", 0), reverse=True)
-    for pid, _ in by_value[:top_n_value]:
-        player_reports.setdefault(pid, []).append("full")
+    for i in _top_k_indices(value_arr, top_n_value):
+        player_reports.setdefault(pids[i], []).append("full")
 
     # Top sleepers get spotlight reports
-    by_sleeper = sorted(scores_list, key=lambda x: x[1].get("sleeper_score", 0), reverse=True)
-    for pid, _ in by_sleeper[:top_n_sleepers]:
-        player_reports.setdefault(pid, []).append("sleeper_spotlight")
+    for i in _top_k_indices(sleeper_arr, top_n_sleepers):
+        player_reports.setdefault(pids[i], []).append("sleeper_spotlight")
 
     # Top busts get warning reports
-    by_bust = sorted(scores_list, key=lambda x: x[1].get("bust_score", 0), reverse=True)
-    for pid, _ in by_bust[:top_n_busts]:
-        player_reports.setdefault(pid, []).append("bust_warning")
+    for i in _top_k_indices(bust_arr, top_n_busts):
+        player_reports.setdefault(pids[i], []).append("bust_warning")
 
     # Young players (under 26) with high value get dynasty outlook
-    young_players = [
-        (pid, s) for pid, s in scores_list
-        if s.get("age", 30) < 26
-    ]
-    by_young_value = sorted(young_players, key=lambda x: x[1].get("ai_value_score", 0), reverse=True)
-    for pid, _ in by_young_value[:50]:
-        player_reports.setdefault(pid, []).append("dynasty_outlook")
+    young_idx = np.flatnonzero(_score_array(score_list, "age", default=30) < 26)
+    for i in young_idx[_top_k_indices(value_arr[young_idx], 50)]:
+        player_reports.setdefault(pids[i], []).append("dynasty_outlook")
 
     total_reports = sum(len(v) for v in player_reports.values())
     logger.info(
@@ -114,3 +164,42 @@ def select_batch_players(
         f"({total_reports} total reports)"
     )
     return player_reports
+
+
+def _score_array(score_list: list[dict], key: str, default: float = 0) -> np.ndarray:
+    """Gather one score field across players into a float array."""
+    return np.fromiter(
+        (s.get(key, default) for s in score_list), dtype=np.float64, count=len(score_list)
+    )
+
+
+def _top_k_indices(values: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k largest values, highest first.
+
+    Equivalent to a stable descending sort truncated to k (ties keep input
+    order). Scores on the 0-100 scale are counted into whole-point buckets to
+    find the cutoff in O(N), so only players at or above the cutoff bucket get
+    sorted; anything else partitions around the k-th value instead. NaN
+    scores rank below every real score.
+    """
+    values = np.where(np.isnan(values), -np.inf, values)
+    n = len(values)
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.intp)
+    if k >= n:
+        return np.argsort(-values, kind="stable")
+
+    if values.min() >= 0 and values.max() <= SCORE_MAX:
+        buckets = values.astype(np.intp)
+        # Count per bucket from the top down; the cutoff is the first bucket
+        # where at least k players have been accumulated
+        top_down = np.cumsum(np.bincount(buckets, minlength=SCORE_MAX + 1)[::-1])
+        cutoff = SCORE_MAX - int(np.searchsorted(top_down, k))
+        idx = np.flatnonzero(buckets >= cutoff)
+        return idx[np.argsort(-values[idx], kind="stable")][:k]
+
+    kth = values[np.argpartition(values, n - k)[n - k]]
+    above = np.flatnonzero(values > kth)
+    ties = np.flatnonzero(values == kth)[: k - len(above)]
+    idx = np.sort(np.concatenate((above, ties)))
+    return idx[np.argsort(-values[idx], kind="stable")]
@@ -5,6 +5,8 @@ rate limits to control costs.
 """
 
 import logging
+import math
+import threading
 import time
 from dataclasses import dataclass, field
 
@@ -18,49 +20,84 @@ DEFAULT_MAX_CONCURRENT = 10
 
 @dataclass
 class CostMonitor:
-    """Tracks and throttles scouting report generation."""
+    """Tracks and throttles scouting report generation.
+
+    Hourly and daily limits are token buckets: each completed report spends
+    one token, and tokens refill continuously at max_per_hour per hour (and
+    max_per_day per day), so every check is O(1) regardless of volume.
+    In-flight requests hold a slot of a BoundedSemaphore(max_concurrent).
+    """
 
     max_per_hour: int = DEFAULT_MAX_REPORTS_PER_HOUR
     max_per_day: int = DEFAULT_MAX_REPORTS_PER_DAY
     max_concurrent: int = DEFAULT_MAX_CONCURRENT
 
-    _hourly_timestamps: list[float] = field(default_factory=list)
-    _daily_timestamps: list[float] = field(default_factory=list)
-    _active_requests: int = 0
+    _hourly_tokens: float = field(init=False)
+    _daily_tokens: float = field(init=False)
+    _last_refill: float = field(init=False)
+    _concurrency: threading.BoundedSemaphore = field(init=False, repr=False, compare=False)
     _total_generated: int = 0
     _total_tokens_estimated: int = 0
 
+    def __post_init__(self) -> None:
+        self._hourly_tokens = float(self.max_per_hour)
+        self._daily_tokens = float(self.max_per_day)
+        self._last_refill = time.monotonic()
+        self._concurrency = threading.BoundedSemaphore(self.max_concurrent)
+
+    @property
+    def _active_requests(self) -> int:
+        """Number of admitted requests that have not completed or failed yet."""
+        return self.max_concurrent - self._concurrency._value
+
+    def _refill(self) -> None:
+        """Credit both buckets for the time elapsed since the last refill."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._hourly_tokens = min(
+            self.max_per_hour, self._hourly_tokens + elapsed * self.max_per_hour / 3600
+        )
+        self._daily_tokens = min(
+            self.max_per_day, self._daily_tokens + elapsed * self.max_per_day / 86400
+        )
+
     def can_generate(self) -> tuple[bool, str]:
         """Check if a new report can be generated within rate limits.
 
         Returns:
             Tuple of (allowed, reason_if_blocked).
         """
-        now = time.time()
-
         # Check concurrent limit
         if self._active_requests >= self.max_concurrent:
             return False, f"Concurrent limit reached ({self.max_concurrent})"
 
-        # Clean old timestamps
-        one_hour_ago = now - 3600
-        one_day_ago = now - 86400
-        self._hourly_timestamps = [t for t in self._hourly_timestamps if t > one_hour_ago]
-        self._daily_timestamps = [t for t in self._daily_timestamps if t > one_day_ago]
+        self._refill()
 
         # Check hourly limit
-        if len(self._hourly_timestamps) >= self.max_per_hour:
+        if self._hourly_tokens < 1:
             return False, f"Hourly limit reached ({self.max_per_hour}/hr)"
 
         # Check daily limit
-        if len(self._daily_timestamps) >= self.max_per_day:
+        if self._daily_tokens < 1:
             return False, f"Daily limit reached ({self.max_per_day}/day)"
 
         return True, ""
 
-    def record_start(self) -> None:
-        """Record the start of a report generation."""
-        self._active_requests += 1
+    def record_start(self) -> bool:
+        """Record the start of a report generation.
+
+        Returns:
+            False if the concurrent limit is already reached (nothing is recorded).
+        """
+        return self._concurrency.acquire(blocking=False)
+
+    def _release(self) -> None:
+        """Free a concurrency slot; releasing with nothing in flight is a no-op."""
+        try:
+            self._concurrency.release()
+        except ValueError:
+            pass
 
     def record_completion(self, estimated_tokens: int = 2000) -> None:
         """Record the completion of a report generation.
@@ -68,25 +105,26 @@ class CostMonitor:
         Args:
             estimated_tokens: Estimated total tokens used (input + output).
         """
-        now = time.time()
-        self._active_requests = max(0, self._active_requests - 1)
-        self._hourly_timestamps.append(now)
-        self._daily_timestamps.append(now)
+        self._refill()
+        self._release()
+        self._hourly_tokens -= 1
+        self._daily_tokens -= 1
         self._total_generated += 1
         self._total_tokens_estimated += estimated_tokens
 
     def record_failure(self) -> None:
         """Record a failed generation (decrement active count)."""
-        self._active_requests = max(0, self._active_requests - 1)
+        self._release()
 
     def get_stats(self) -> dict:
-        """Get current usage statistics."""
-        now = time.time()
-        one_hour_ago = now - 3600
-        one_day_ago = now - 86400
+        """Get current usage statistics.
 
-        hourly_count = len([t for t in self._hourly_timestamps if t > one_hour_ago])
-        daily_count = len([t for t in self._daily_timestamps if t > one_day_ago])
+        Hourly/daily counts are the reports still drawn against each bucket,
+        i.e. the spent tokens that have not yet refilled.
+        """
+        self._refill()
+        hourly_count = math.ceil(self.max_per_hour - self._hourly_tokens)
+        daily_count = math.ceil(self.max_per_day - self._daily_tokens)
 
         # Rough cost estimate: ~$0.003 per 1K input tokens, ~$0.015 per 1K output tokens
         # Average report: ~1500 input + ~800 output tokens
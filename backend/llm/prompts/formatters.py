@@ -4,8 +4,70 @@ Assembles biographical info, stats, model scores, trends, and auction context in
 a structured text document that the LLM can use to generate grounded scouting reports.
 """
 
+import functools
+from string import Template
 from typing import Any
 
+# Section scaffolding and display tables are built once at import time;
+# the per-call work is only the value lookups and line formatting.
+
+_BIO_TEMPLATE = Template(
+    "### Player Profile\n"
+    "- **Name:** $name\n"
+    "- **Age:** $age\n"
+    "- **Team:** $team\n"
+    "- **Position:** $position"
+)
+
+_SCORE_DISPLAY = (
+    ("AI Value Score", "ai_value_score", "/100"),
+    ("Sleeper Score", "sleeper_score", "/100"),
+    ("Bust Score", "bust_score", "/100"),
+    ("Consistency Score", "consistency_score", "/100"),
+    ("Improvement Score", "improvement_score", "(-100 to 100)"),
+    ("Regression Direction", "regression_direction", "(positive = improving)"),
+)
+
+_DIFFERENTIALS = (
+    ("wOBA vs xwOBA", "woba", "xwoba"),
+    ("BA vs xBA", "avg", "xba"),
+    ("SLG vs xSLG", "slg", "xslg"),
+    ("ERA vs xERA", "era", "xera"),
+    ("ERA vs FIP", "era", "fip"),
+)
+
+_PITCHER_DISPLAY_STATS = (
+    ("ERA", "era"), ("WHIP", "whip"), ("FIP", "fip"), ("xFIP", "xfip"),
+    ("SIERA", "siera"), ("K%", "k_pct"), ("BB%", "bb_pct"), ("K-BB%", "k_bb_pct"),
+    ("SwStr%", "swstr_pct"), ("CSW%", "csw_pct"),
+    ("Barrel% Against", "barrel_pct_against"), ("Hard Hit% Against", "hard_hit_pct_against"),
+    ("GB%", "gb_pct"), ("HR/FB%", "hr_fb_pct"), ("LOB%", "lob_pct"),
+    ("WAR", "war"), ("IP", "ip"),
+)
+
+_BATTER_DISPLAY_STATS = (
+    ("AVG", "avg"), ("OBP", "obp"), ("SLG", "slg"), ("wOBA", "woba"),
+    ("xwOBA", "xwoba"), ("wRC+", "wrc_plus"), ("ISO", "iso"), ("BABIP", "babip"),
+    ("K%", "k_pct"), ("BB%", "bb_pct"), ("Barrel%", "barrel_pct"),
+    ("Hard Hit%", "hard_hit_pct"), ("Avg Exit Velocity", "avg_exit_velocity"),
+    ("Sprint Speed", "sprint_speed"), ("WAR", "war"), ("PA", "pa"),
+)
+
+_PITCHER_TREND_STATS = [
+    ("K%", "k_pct"), ("BB%", "bb_pct"), ("K-BB%", "k_bb_pct"),
+    ("SwStr%", "swstr_pct"), ("ERA", "era"), ("FIP", "fip"),
+    ("SIERA", "siera"), ("Barrel% Against", "barrel_pct_against"),
+]
+
+_BATTER_TREND_STATS = [
+    ("K%", "k_pct"), ("BB%", "bb_pct"), ("Barrel%", "barrel_pct"),
+    ("Hard Hit%", "hard_hit_pct"), ("Exit Velocity", "avg_exit_velocity"),
+    ("wOBA", "woba"), ("xwOBA", "xwoba"), ("ISO", "iso"),
+]
+
+# For pitcher ERA/FIP/WHIP, lower is better
+_PITCHER_LOWER_IS_BETTER = frozenset({"era", "fip", "xfip", "siera", "whip", "bb_pct"})
+
 
 def format_player_context(
     player: dict,
@@ -63,11 +125,12 @@ def format_player_context(
 
 def _format_bio(player: dict) -> str:
     """Format player biographical information."""
-    lines = ["### Player Profile"]
-    lines.append(f"- **Name:** {player.get('full_name', 'Unknown')}")
-    lines.append(f"- **Age:** {player.get('age', 'Unknown')}")
-    lines.append(f"- **Team:** {player.get('team', 'Unknown')}")
-    lines.append(f"- **Position:** {player.get('position', 'Unknown')}")
+    lines = [_BIO_TEMPLATE.substitute(
+        name=player.get("full_name", "Unknown"),
+        age=player.get("age", "Unknown"),
+        team=player.get("team", "Unknown"),
+        position=player.get("position", "Unknown"),
+    )]
 
     if player.get("prospect_rank"):
         lines.append(f"- **Historical Prospect Rank:** #{player['prospect_rank']}")
@@ -121,16 +184,7 @@ def _format_model_scores(scores: dict) -> str:
     """Format model prediction scores."""
     lines = ["### AI Model Scores"]
 
-    score_display = [
-        ("AI Value Score", "ai_value_score", "/100"),
-        ("Sleeper Score", "sleeper_score", "/100"),
-        ("Bust Score", "bust_score", "/100"),
-        ("Consistency Score", "consistency_score", "/100"),
-        ("Improvement Score", "improvement_score", "(-100 to 100)"),
-        ("Regression Direction", "regression_direction", "(positive = improving)"),
-    ]
-
-    for display_name, key, suffix in score_display:
+    for display_name, key, suffix in _SCORE_DISPLAY:
         val = scores.get(key)
         if val is not None:
             lines.append(f"- **{display_name}:** {val:.1f} {suffix}")
@@ -175,15 +229,7 @@ def _format_differentials(stats: dict) -> str:
     """Format actual vs. expected stat differentials."""
     lines = ["### Performance vs. Expected (Luck Gap)"]
 
-    diffs = [
-        ("wOBA vs xwOBA", "woba", "xwoba"),
-        ("BA vs xBA", "avg", "xba"),
-        ("SLG vs xSLG", "slg", "xslg"),
-        ("ERA vs xERA", "era", "xera"),
-        ("ERA vs FIP", "era", "fip"),
-    ]
-
-    for display_name, actual_key, expected_key in diffs:
+    for display_name, actual_key, expected_key in _DIFFERENTIALS:
         actual = stats.get(actual_key)
         expected = stats.get(expected_key)
         if actual is not None and expected is not None:
@@ -206,27 +252,41 @@ def _format_differentials(stats: dict) -> str:
 
 def _format_dynasty_context(player: dict, scores: dict) -> str:
     """Format dynasty-specific context."""
+    dynasty_val = scores.get("dynasty_value")
+    return _format_dynasty_section(
+        _career_arc(player.get("age")),
+        None if dynasty_val is None else round(dynasty_val, 1),
+        scores.get("keep_cut_horizon"),
+    )
+
+
+def _career_arc(age: int | None) -> str | None:
+    """Describe where a player sits on the aging curve."""
+    if not age:
+        return None
+    if age < 25:
+        return "Early development phase — significant growth potential"
+    elif age < 27:
+        return "Pre-peak — approaching prime years"
+    elif age <= 29:
+        return "Peak production window"
+    elif age <= 32:
+        return "Early decline phase — still productive but monitor trends"
+    return "Late career — declining trajectory expected"
+
+
+# Section inputs are reduced to what the text actually shows (the arc label and
+# values at display precision), so players in the same tier share one cached string.
+@functools.lru_cache(maxsize=2048, typed=True)
+def _format_dynasty_section(
+    arc: str | None, dynasty_val: float | None, keep_cut: int | None
+) -> str:
     lines = ["### Dynasty Context"]
 
-    age = player.get("age")
-    if age:
-        if age < 25:
-            arc = "Early development phase — significant growth potential"
-        elif age < 27:
-            arc = "Pre-peak — approaching prime years"
-        elif age <= 29:
-            arc = "Peak production window"
-        elif age <= 32:
-            arc = "Early decline phase — still productive but monitor trends"
-        else:
-            arc = "Late career — declining trajectory expected"
+    if arc is not None:
         lines.append(f"- **Career Arc:** {arc}")
-
-    dynasty_val = scores.get("dynasty_value")
     if dynasty_val is not None:
         lines.append(f"- **Dynasty Value Score:** {dynasty_val:.1f}/100")
-
-    keep_cut = scores.get("keep_cut_horizon")
     if keep_cut is not None:
         lines.append(f"- **Keep/Cut Horizon:** {keep_cut} years before cost exceeds value")
 
@@ -235,19 +295,32 @@ def _format_dynasty_context(player: dict, scores: dict) -> str:
 
 def _format_auction_context(scores: dict) -> str:
     """Format auction valuation context."""
+    auction_val = scores.get("auction_value")
+    expected_cost = scores.get("expected_cost")
+    surplus = scores.get("surplus_value")
+    return _format_auction_section(
+        None if auction_val is None else round(auction_val, 1),
+        None if expected_cost is None else round(expected_cost, 1),
+        None if surplus is None else round(surplus, 1),
+        surplus is not None and surplus > 0,
+    )
+
+
+@functools.lru_cache(maxsize=2048, typed=True)
+def _format_auction_section(
+    auction_val: float | None,
+    expected_cost: float | None,
+    surplus: float | None,
+    is_surplus: bool,
+) -> str:
     lines = ["### Auction Valuation"]
 
-    auction_val = scores.get("auction_value")
     if auction_val is not None:
         lines.append(f"- **Projected Dollar Value:** ${auction_val:.1f}")
-
-    expected_cost = scores.get("expected_cost")
     if expected_cost is not None:
         lines.append(f"- **Expected Auction Cost:** ${expected_cost:.1f}")
-
-    surplus = scores.get("surplus_value")
     if surplus is not None:
-        label = "surplus" if surplus > 0 else "deficit"
+        label = "surplus" if is_surplus else "deficit"
         lines.append(f"- **Surplus Value:** ${surplus:+.1f} ({label})")
 
     return "\n".join(lines)
@@ -256,62 +329,13 @@ def _format_auction_context(scores: dict) -> str:
 def _get_display_stats(stats: dict) -> dict[str, Any]:
     """Get displayable stat name -> value mapping based on player type."""
     is_pitcher = stats.get("era") is not None
-
-    if is_pitcher:
-        return {
-            "ERA": stats.get("era"),
-            "WHIP": stats.get("whip"),
-            "FIP": stats.get("fip"),
-            "xFIP": stats.get("xfip"),
-            "SIERA": stats.get("siera"),
-            "K%": stats.get("k_pct"),
-            "BB%": stats.get("bb_pct"),
-            "K-BB%": stats.get("k_bb_pct"),
-            "SwStr%": stats.get("swstr_pct"),
-            "CSW%": stats.get("csw_pct"),
-            "Barrel% Against": stats.get("barrel_pct_against"),
-            "Hard Hit% Against": stats.get("hard_hit_pct_against"),
-            "GB%": stats.get("gb_pct"),
-            "HR/FB%": stats.get("hr_fb_pct"),
-            "LOB%": stats.get("lob_pct"),
-            "WAR": stats.get("war"),
-            "IP": stats.get("ip"),
-        }
-    else:
-        return {
-            "AVG": stats.get("avg"),
-            "OBP": stats.get("obp"),
-            "SLG": stats.get("slg"),
-            "wOBA": stats.get("woba"),
-            "xwOBA": stats.get("xwoba"),
-            "wRC+": stats.get("wrc_plus"),
-            "ISO": stats.get("iso"),
-            "BABIP": stats.get("babip"),
-            "K%": stats.get("k_pct"),
-            "BB%": stats.get("bb_pct"),
-            "Barrel%": stats.get("barrel_pct"),
-            "Hard Hit%": stats.get("hard_hit_pct"),
-            "Avg Exit Velocity": stats.get("avg_exit_velocity"),
-            "Sprint Speed": stats.get("sprint_speed"),
-            "WAR": stats.get("war"),
-            "PA": stats.get("pa"),
-        }
+    display = _PITCHER_DISPLAY_STATS if is_pitcher else _BATTER_DISPLAY_STATS
+    return {name: stats.get(key) for name, key in display}
 
 
 def _get_trend_stat_names(is_pitcher: bool) -> list[tuple[str, str]]:
     """Get (display_name, column_name) pairs for trend tracking."""
-    if is_pitcher:
-        return [
-            ("K%", "k_pct"), ("BB%", "bb_pct"), ("K-BB%", "k_bb_pct"),
-            ("SwStr%", "swstr_pct"), ("ERA", "era"), ("FIP", "fip"),
-            ("SIERA", "siera"), ("Barrel% Against", "barrel_pct_against"),
-        ]
-    else:
-        return [
-            ("K%", "k_pct"), ("BB%", "bb_pct"), ("Barrel%", "barrel_pct"),
-            ("Hard Hit%", "hard_hit_pct"), ("Exit Velocity", "avg_exit_velocity"),
-            ("wOBA", "woba"), ("xwOBA", "xwoba"), ("ISO", "iso"),
-        ]
+    return _PITCHER_TREND_STATS if is_pitcher else _BATTER_TREND_STATS
 
 
 def _trend_direction(stats: list[dict], col: str, is_pitcher: bool) -> str:
@@ -324,8 +348,7 @@ def _trend_direction(stats: list[dict], col: str, is_pitcher: bool) -> str:
         return ""
 
     diff = curr - prev
-    # For pitcher ERA/FIP/WHIP, lower is better
-    lower_is_better = is_pitcher and col in ("era", "fip", "xfip", "siera", "whip", "bb_pct")
+    lower_is_better = is_pitcher and col in _PITCHER_LOWER_IS_BETTER
 
     if abs(diff) < 0.005:
         return "(stable)"
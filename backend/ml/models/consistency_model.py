@@ -12,6 +12,11 @@ import logging
 import numpy as np
 import pandas as pd
 
+try:  # numba is an optional speed-up for league-wide runs
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 logger = logging.getLogger(__name__)
 
 # Stickiness tiers: stat -> (tier_weight, higher_is_better)
@@ -48,9 +53,18 @@ PITCHER_STICKY_STATS = {
     "stuff_plus": (0.4, True),
 }
 
+# Stat names and tier weights unpacked once, in table order, for the array math
+_BATTER_STATS: tuple[str, ...] = tuple(BATTER_STICKY_STATS)
+_BATTER_WEIGHTS = np.array([w for w, _ in BATTER_STICKY_STATS.values()], dtype=np.float64)
+_PITCHER_STATS: tuple[str, ...] = tuple(PITCHER_STICKY_STATS)
+_PITCHER_WEIGHTS = np.array([w for w, _ in PITCHER_STICKY_STATS.values()], dtype=np.float64)
+
 MIN_SEASONS = 2
 PREFERRED_SEASONS = 3
 
+# Below this many players the parallel kernel's thread startup costs more than it saves
+_PARALLEL_MIN_PLAYERS = 256
+
 
 def calculate_batter_consistency(batting_df: pd.DataFrame) -> pd.DataFrame:
     """Calculate consistency scores for all batters.
@@ -61,7 +75,9 @@ def calculate_batter_consistency(batting_df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with player_id, consistency_score (0-100), stat_breakdown (dict).
     """
-    return _calculate_consistency(batting_df, BATTER_STICKY_STATS, "pa", min_playing_time=200)
+    return _calculate_consistency(
+        batting_df, _BATTER_STATS, _BATTER_WEIGHTS, "pa", min_playing_time=200
+    )
 
 
 def calculate_pitcher_consistency(pitching_df: pd.DataFrame) -> pd.DataFrame:
@@ -73,12 +89,15 @@ def calculate_pitcher_consistency(pitching_df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with player_id, consistency_score (0-100), stat_breakdown (dict).
     """
-    return _calculate_consistency(pitching_df, PITCHER_STICKY_STATS, "ip", min_playing_time=40)
+    return _calculate_consistency(
+        pitching_df, _PITCHER_STATS, _PITCHER_WEIGHTS, "ip", min_playing_time=40
+    )
 
 
 def _calculate_consistency(
     df: pd.DataFrame,
-    sticky_stats: dict,
+    sticky_stats: tuple[str, ...],
+    sticky_weights: np.ndarray,
     playing_time_col: str,
     min_playing_time: float,
 ) -> pd.DataFrame:
@@ -90,71 +109,136 @@ def _calculate_consistency(
     3. Convert CV to per-stat consistency (1 - normalized_cv)
     4. Weighted average using stickiness tier weights
     5. Scale to 0-100
+
+    All players are aggregated at once with a single groupby; only the
+    per-stat breakdown dicts are assembled in Python.
     """
-    results = []
+    # Filter to qualifying seasons and take each player's most recent 3
+    playing_time = df[playing_time_col]
+    qualifying = df[playing_time.notna() & (playing_time >= min_playing_time)]
+    recent = (
+        qualifying.sort_values(["player_id", "season"], ascending=[True, False], kind="stable")
+        .groupby("player_id")
+        .head(PREFERRED_SEASONS)
+    )
+
+    seasons_used = recent.groupby("player_id").size()
+    seasons_used = seasons_used[seasons_used >= MIN_SEASONS]
+    recent = recent[recent["player_id"].isin(seasons_used.index)]
+
+    present = np.array([stat in recent.columns for stat in sticky_stats], dtype=bool)
+    stats = [stat for stat, has_stat in zip(sticky_stats, present) if has_stat]
+    weights = sticky_weights[present]
+    if seasons_used.empty or not stats:
+        logger.info("Calculated consistency scores for 0 players")
+        return pd.DataFrame()
+
+    if njit is not None and len(seasons_used) >= _PARALLEL_MIN_PLAYERS:
+        counts, means, stds = _stat_moments_kernel(_season_cube(recent, stats))
+    else:
+        grouped = recent.groupby("player_id")[stats]
+        counts = grouped.count().to_numpy()
+        means = grouped.mean().to_numpy(dtype=np.float64)
+        stds = grouped.std(ddof=1).to_numpy(dtype=np.float64)
+
+    # CV = std / |mean| — measures relative variability
+    # Handle edge cases: if mean is 0 or very small, use absolute std
+    # (penalize if mean is ~0 but there's variance)
+    abs_means = np.abs(means)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cvs = np.where(abs_means > 1e-6, stds / abs_means, stds * 10)
+
+    # Per-stat consistency: 1 = perfectly consistent, 0 = wildly variable.
+    # CV is capped at 1.0 (anything above = wildly inconsistent)
+    consistencies = 1.0 - np.minimum(cvs, 1.0)
+    valid = counts >= MIN_SEASONS
+
+    # Accumulate stat by stat so each player's sum runs in the same order
+    weighted_sum = np.zeros(len(seasons_used))
+    weight_total = np.zeros(len(seasons_used))
+    for j, weight in enumerate(weights):
+        weighted_sum += np.where(valid[:, j], weight * consistencies[:, j], 0.0)
+        weight_total += np.where(valid[:, j], weight, 0.0)
 
-    for player_id, group in df.groupby("player_id"):
-        # Filter to qualifying seasons and take the most recent 3
-        qualifying = group[
-            (group[playing_time_col].notna()) & (group[playing_time_col] >= min_playing_time)
-        ].sort_values("season", ascending=False).head(PREFERRED_SEASONS)
-
-        if len(qualifying) < MIN_SEASONS:
-            continue
-
-        stat_breakdown = {}
-        weighted_sum = 0.0
-        weight_total = 0.0
-
-        for stat, (tier_weight, _direction) in sticky_stats.items():
-            if stat not in qualifying.columns:
-                continue
-
-            values = qualifying[stat].dropna()
-            if len(values) < MIN_SEASONS:
-                continue
-
-            mean_val = values.mean()
-            std_val = values.std(ddof=1)
-
-            # CV = std / |mean| — measures relative variability
-            # Handle edge cases: if mean is 0 or very small, use absolute std
-            if abs(mean_val) > 1e-6:
-                cv = std_val / abs(mean_val)
-            else:
-                cv = std_val * 10  # Penalize if mean is ~0 but there's variance
-
-            # Normalize CV: cap at 1.0 (anything above = wildly inconsistent)
-            normalized_cv = min(cv, 1.0)
-
-            # Per-stat consistency: 1 = perfectly consistent, 0 = wildly variable
-            stat_consistency = 1.0 - normalized_cv
-
-            stat_breakdown[stat] = {
-                "consistency": round(stat_consistency, 4),
-                "cv": round(cv, 4),
-                "mean": round(mean_val, 4),
-                "std": round(std_val, 4),
-                "seasons_used": len(values),
+    results = []
+    player_ids = seasons_used.index.tolist()
+    season_counts = seasons_used.tolist()
+    for i in np.flatnonzero(weight_total > 0):
+        stat_breakdown = {
+            stat: {
+                "consistency": round(consistencies[i, j], 4),
+                "cv": round(cvs[i, j], 4),
+                "mean": round(means[i, j], 4),
+                "std": round(stds[i, j], 4),
+                "seasons_used": int(counts[i, j]),
             }
+            for j, stat in enumerate(stats)
+            if valid[i, j]
+        }
 
-            weighted_sum += tier_weight * stat_consistency
-            weight_total += tier_weight
-
-        if weight_total == 0:
-            continue
-
-        raw_score = weighted_sum / weight_total
+        raw_score = weighted_sum[i] / weight_total[i]
         # Scale to 0-100
         consistency_score = round(raw_score * 100, 1)
 
         results.append({
-            "player_id": player_id,
+            "player_id": player_ids[i],
             "consistency_score": consistency_score,
             "stat_consistency_breakdown": stat_breakdown,
-            "seasons_used": len(qualifying),
+            "seasons_used": season_counts[i],
         })
 
     result_df = pd.DataFrame(results)
     logger.info(f"Calculated consistency scores for {len(result_df)} players")
     return result_df
+
+
+def _season_cube(recent: pd.DataFrame, stats: list[str]) -> np.ndarray:
+    """Lay out each player's recent seasons as a (players, stats, seasons) array.
+
+    ``recent`` must be sorted by player_id, most recent season first. Slots for
+    seasons a player doesn't have are NaN.
+    """
+    player_idx = recent.groupby("player_id").ngroup().to_numpy()
+    season_idx = recent.groupby("player_id").cumcount().to_numpy()
+    cube = np.full(
+        (player_idx.max(initial=-1) + 1, len(stats), PREFERRED_SEASONS), np.nan
+    )
+    cube[player_idx, :, season_idx] = recent[stats].to_numpy(dtype=np.float64)
+    return cube
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def _stat_moments_kernel(cube):
+        """Per (player, stat) non-null count, mean and sample std over the season axis."""
+        n_players, n_stats, n_seasons = cube.shape
+        counts = np.zeros((n_players, n_stats), dtype=np.int64)
+        means = np.full((n_players, n_stats), np.nan)
+        stds = np.full((n_players, n_stats), np.nan)
+
+        # Each player writes only its own output row, so iterations are independent
+        for i in prange(n_players):
+            for j in range(n_stats):
+                total = 0.0
+                n = 0
+                for k in range(n_seasons):
+                    value = cube[i, j, k]
+                    if not np.isnan(value):
+                        total += value
+                        n += 1
+                counts[i, j] = n
+                if n == 0:
+                    continue
+                mean = total / n
+                means[i, j] = mean
+                if n < 2:
+                    continue
+                sq_dev = 0.0
+                for k in range(n_seasons):
+                    value = cube[i, j, k]
+                    if not np.isnan(value):
+                        sq_dev += (value - mean) ** 2
+                stds[i, j] = np.sqrt(sq_dev / (n - 1))
+
+        return counts, means, stds
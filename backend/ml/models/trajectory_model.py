@@ -13,6 +13,12 @@ import logging
 from dataclasses import dataclass
 
 import numpy as np
+import pandas as pd
+
+try:  # numba is an optional speed-up for large batches
+    from numba import njit, prange
+except ImportError:
+    njit = None
 
 logger = logging.getLogger(__name__)
 
@@ -33,10 +39,41 @@ PITCHER_AGING_CURVE = {
     38: 0.30, 39: 0.23, 40: 0.17,
 }
 
+# Pre-sorted (ages, factors) node arrays for each curve, built once at import so
+# lookups can binary-search instead of re-sorting the dict keys on every call
+_BATTER_AGES_SORTED = np.array(sorted(BATTER_AGING_CURVE), dtype=np.int16)
+_BATTER_VALUES_SORTED = np.array(
+    [BATTER_AGING_CURVE[a] for a in _BATTER_AGES_SORTED], dtype=np.float32
+)
+_PITCHER_AGES_SORTED = np.array(sorted(PITCHER_AGING_CURVE), dtype=np.int16)
+_PITCHER_VALUES_SORTED = np.array(
+    [PITCHER_AGING_CURVE[a] for a in _PITCHER_AGES_SORTED], dtype=np.float32
+)
+_BATTER_CURVE = (_BATTER_AGES_SORTED, _BATTER_VALUES_SORTED)
+_PITCHER_CURVE = (_PITCHER_AGES_SORTED, _PITCHER_VALUES_SORTED)
+
+# Defaults applied by batch_project_trajectories for fields a player omits
+_BATCH_DEFAULTS = {
+    "age": 28,
+    "current_value": 50,
+    "player_type": "batter",
+    "improvement_score": 0,
+    "consistency_score": 50,
+}
+
+# Below this many players the parallel kernel's thread startup costs more than it saves
+_PARALLEL_MIN_PLAYERS = 256
+
 # Confidence band widths (std dev multiplier per year into the future)
 # Year 1 is fairly predictable, gets progressively wider
 BASE_CONFIDENCE_WIDTHS = [0.08, 0.14, 0.20, 0.26, 0.32, 0.38, 0.44, 0.50]
 
+# Widths indexed by (year_offset - 1), with the last width replicated past the
+# end of the base schedule so lookups are a plain gather with no clamping
+_CONFIDENCE_WIDTHS = np.array(
+    BASE_CONFIDENCE_WIDTHS + [BASE_CONFIDENCE_WIDTHS[-1]] * 32, dtype=np.float32
+)
+
 
 @dataclass
 class TrajectoryPoint:
@@ -89,70 +126,241 @@ def project_career_trajectory(
     Returns:
         CareerTrajectory with year-by-year projections and confidence bands.
     """
-    aging_curve = BATTER_AGING_CURVE if player_type == "batter" else PITCHER_AGING_CURVE
-    peak_age = 27 if player_type == "batter" else 26
+    if current_value <= 0:
+        # Every projection and band scales with current value, so a replacement-level
+        # player projects to all zeros; skip the aging-curve math entirely
+        zeros = np.zeros((1, projection_years), dtype=np.float32)
+        projected = upper = lower = zeros
+    else:
+        projected, upper, lower = _project_value_matrix(
+            current_ages=np.array([current_age]),
+            current_values=np.array([current_value], dtype=np.float32),
+            is_pitcher=np.array([player_type != "batter"]),
+            improvement_scores=np.array([improvement_score], dtype=np.float32),
+            consistency_scores=np.array([consistency_score], dtype=np.float32),
+            projection_years=projection_years,
+        )
+    return _build_trajectory(
+        player_id=player_id,
+        current_age=current_age,
+        current_value=current_value,
+        peak_age=27 if player_type == "batter" else 26,
+        improvement_score=improvement_score,
+        projected=projected[0],
+        upper=upper[0],
+        lower=lower[0],
+        current_season=current_season,
+    )
+
+
+def _project_value_matrix(
+    current_ages: np.ndarray,
+    current_values: np.ndarray,
+    is_pitcher: np.ndarray,
+    improvement_scores: np.ndarray,
+    consistency_scores: np.ndarray,
+    projection_years: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Project values and confidence bands for many players at once.
+
+    Every input is a length-N array; the outputs are (N, projection_years)
+    arrays of projected value, upper bound and lower bound (unrounded).
+    Scores are computed in float32: every quantity is a 0-100 score, so the
+    extra float64 precision buys nothing but memory traffic.
+    """
+    peak_ages = np.where(is_pitcher, 26, 27)
 
     # Estimate the player's peak value from current performance + age position
-    current_age_factor = _get_age_factor(current_age, aging_curve)
-    if current_age_factor > 0:
-        estimated_peak_value = min(100, current_value / current_age_factor)
-    else:
-        estimated_peak_value = current_value
+    current_age_factor = _age_factors(current_ages, is_pitcher)
+    safe_factor = np.where(current_age_factor > 0, current_age_factor, 1.0)
+    estimated_peak_value = np.where(
+        current_age_factor > 0,
+        np.minimum(100, current_values / safe_factor),
+        current_values,
+    )
 
     # Adjust peak estimate based on improvement trajectory
     # Improving players may not have reached their true peak yet
-    improvement_adjustment = _improvement_adjustment(improvement_score, current_age, peak_age)
-    estimated_peak_value = min(100, estimated_peak_value * (1 + improvement_adjustment))
+    improvement_adjustment = _improvement_adjustment(
+        improvement_scores, current_ages, peak_ages
+    )
+    estimated_peak_value = np.minimum(100, estimated_peak_value * (1 + improvement_adjustment))
 
     # Consistency affects confidence band width (inconsistent = wider bands)
-    consistency_factor = max(0.5, consistency_score / 100)  # 0.5 to 1.0
+    consistency_factor = np.maximum(0.5, consistency_scores / 100)  # 0.5 to 1.0
+
+    year_offsets = np.arange(1, projection_years + 1)
+    future_ages = current_ages[:, None] + year_offsets[None, :]
 
-    trajectory_points = []
-    peak_proj_value = 0.0
-    peak_proj_season = current_season + 1
+    # Base projection from aging curve
+    future_age_factor = _age_factors(future_ages, is_pitcher[:, None])
+    projected = estimated_peak_value[:, None] * future_age_factor
 
-    for year_offset in range(1, projection_years + 1):
-        future_age = current_age + year_offset
-        future_season = current_season + year_offset
+    # Apply improvement momentum (decays over time)
+    improving = (improvement_scores[:, None] > 0) & (future_ages <= peak_ages[:, None] + 2)
+    decay = np.maximum(0, 1 - year_offsets * 0.25).astype(np.float32)
+    momentum = improvement_scores[:, None] / 100 * decay
+    projected = np.where(improving, projected * (1 + momentum * 0.15), projected)
 
-        # Base projection from aging curve
-        future_age_factor = _get_age_factor(future_age, aging_curve)
-        projected_value = estimated_peak_value * future_age_factor
+    projected = np.clip(projected, 0, 100)
 
-        # Apply improvement momentum (decays over time)
-        if improvement_score > 0 and future_age <= peak_age + 2:
-            momentum = improvement_score / 100 * max(0, 1 - year_offset * 0.25)
-            projected_value *= (1 + momentum * 0.15)
+    # Confidence bands
+    base_width = _confidence_widths(projection_years)
 
-        projected_value = max(0, min(100, projected_value))
+    # Wider bands for inconsistent players, narrower for consistent ones
+    adjusted_width = base_width[None, :] / consistency_factor[:, None]
 
-        # Confidence bands
-        band_idx = min(year_offset - 1, len(BASE_CONFIDENCE_WIDTHS) - 1)
-        base_width = BASE_CONFIDENCE_WIDTHS[band_idx]
+    # Wider bands for older players (more injury/retirement risk)
+    adjusted_width = np.where(
+        future_ages > 32,
+        adjusted_width * (1.0 + (future_ages - 32).astype(np.float32) * 0.1),
+        adjusted_width,
+    )
+
+    band = projected * adjusted_width
+    upper = np.minimum(100, projected + band)
+    lower = np.maximum(0, projected - band)
+    return projected, upper, lower
+
+
+if njit is not None:
+    # Scalar float32 constructor; keeps kernel arithmetic in float32 like the NumPy path
+    _F32 = np.float32
+
+    @njit(cache=True)
+    def _kernel_age_factor(age, curve_ages, curve_values):
+        if age < curve_ages[0]:
+            return curve_values[0] * _F32(0.9)
+        if age > curve_ages[-1]:
+            return max(_F32(0.05), curve_values[-1] * _F32(0.5))
+        idx = np.searchsorted(curve_ages, age)
+        if curve_ages[idx] == age:
+            return curve_values[idx]
+        # Same float64 formula as np.interp, so fractional ages match the NumPy path
+        lo_age = curve_ages[idx - 1]
+        lo_value = np.float64(curve_values[idx - 1])
+        slope = (np.float64(curve_values[idx]) - lo_value) / (curve_ages[idx] - lo_age)
+        return _F32(slope * (age - lo_age) + lo_value)
+
+    @njit(parallel=True, cache=True)
+    def _trajectory_kernel(
+        current_ages, current_values, is_pitcher, improvement_scores, consistency_scores,
+        projection_years, batter_ages, batter_values, pitcher_ages, pitcher_values, widths,
+    ):
+        n = current_ages.shape[0]
+        projected = np.empty((n, projection_years), dtype=np.float32)
+        upper = np.empty((n, projection_years), dtype=np.float32)
+        lower = np.empty((n, projection_years), dtype=np.float32)
+
+        # Each player writes only its own output row, so iterations are independent
+        for i in prange(n):
+            age = current_ages[i]
+            improvement = improvement_scores[i]
+            if is_pitcher[i]:
+                curve_ages, curve_values, peak_age = pitcher_ages, pitcher_values, 26
+            else:
+                curve_ages, curve_values, peak_age = batter_ages, batter_values, 27
+
+            factor = _kernel_age_factor(age, curve_ages, curve_values)
+            peak_value = current_values[i]
+            if factor > 0:
+                peak_value = min(_F32(100), peak_value / factor)
+
+            if age > peak_age + 3:
+                adjustment = max(_F32(-0.15), improvement / _F32(1000))
+            elif improvement > 0:
+                age_trust = max(_F32(0.3), _F32(1) - _F32(age - 22) * _F32(0.1))
+                adjustment = min(
+                    _F32(0.25), improvement / _F32(100) * _F32(0.2) * age_trust
+                )
+            else:
+                adjustment = max(_F32(-0.20), improvement / _F32(100) * _F32(0.15))
+            peak_value = min(_F32(100), peak_value * (_F32(1) + adjustment))
+
+            consistency_factor = max(_F32(0.5), consistency_scores[i] / _F32(100))
+
+            for j in range(projection_years):
+                year_offset = j + 1
+                future_age = age + year_offset
+                value = peak_value * _kernel_age_factor(future_age, curve_ages, curve_values)
+                if improvement > 0 and future_age <= peak_age + 2:
+                    decay = max(_F32(0), _F32(1) - _F32(year_offset) * _F32(0.25))
+                    momentum = improvement / _F32(100) * decay
+                    value *= _F32(1) + momentum * _F32(0.15)
+                value = min(_F32(100), max(_F32(0), value))
+
+                width = widths[j] / consistency_factor
+                if future_age > 32:
+                    width *= _F32(1) + _F32(future_age - 32) * _F32(0.1)
+
+                band = value * width
+                projected[i, j] = value
+                upper[i, j] = min(_F32(100), value + band)
+                lower[i, j] = max(_F32(0), value - band)
+
+        return projected, upper, lower
+
+
+def _project_value_matrix_parallel(
+    current_ages: np.ndarray,
+    current_values: np.ndarray,
+    is_pitcher: np.ndarray,
+    improvement_scores: np.ndarray,
+    consistency_scores: np.ndarray,
+    projection_years: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Numba-parallel equivalent of _project_value_matrix (requires numba)."""
+    return _trajectory_kernel(
+        current_ages.astype(np.float64),
+        current_values.astype(np.float32),
+        is_pitcher.astype(np.bool_),
+        improvement_scores.astype(np.float32),
+        consistency_scores.astype(np.float32),
+        projection_years,
+        _BATTER_AGES_SORTED.astype(np.float64),
+        _BATTER_VALUES_SORTED,
+        _PITCHER_AGES_SORTED.astype(np.float64),
+        _PITCHER_VALUES_SORTED,
+        _confidence_widths(projection_years),
+    )
 
-        # Wider bands for inconsistent players, narrower for consistent ones
-        adjusted_width = base_width / consistency_factor
 
-        # Wider bands for older players (more injury/retirement risk)
-        if future_age > 32:
-            adjusted_width *= 1.0 + (future_age - 32) * 0.1
+def _confidence_widths(projection_years: int) -> np.ndarray:
+    """Base band width for each projected year (year 1 first)."""
+    if projection_years <= len(_CONFIDENCE_WIDTHS):
+        return _CONFIDENCE_WIDTHS[:projection_years]
+    return np.pad(_CONFIDENCE_WIDTHS, (0, projection_years - len(_CONFIDENCE_WIDTHS)), mode="edge")
 
-        band = projected_value * adjusted_width
-        upper = min(100, projected_value + band)
-        lower = max(0, projected_value - band)
 
-        point = TrajectoryPoint(
-            season=future_season,
-            projected_value=round(projected_value, 1),
-            upper_bound=round(upper, 1),
-            lower_bound=round(lower, 1),
-            age=future_age,
+def _build_trajectory(
+    player_id: int,
+    current_age: int,
+    current_value: float,
+    peak_age: int,
+    improvement_score: float,
+    projected: np.ndarray,
+    upper: np.ndarray,
+    lower: np.ndarray,
+    current_season: int,
+) -> CareerTrajectory:
+    """Assemble a CareerTrajectory from one player's projection rows."""
+    trajectory_points = [
+        TrajectoryPoint(
+            season=current_season + year_offset,
+            projected_value=round(float(value), 1),
+            upper_bound=round(float(hi), 1),
+            lower_bound=round(float(lo), 1),
+            age=current_age + year_offset,
+        )
+        for year_offset, value, hi, lo in zip(
+            range(1, len(projected) + 1), projected, upper, lower
         )
-        trajectory_points.append(point)
+    ]
 
-        if projected_value > peak_proj_value:
-            peak_proj_value = projected_value
-            peak_proj_season = future_season
+    # First season reaching the maximum; all-zero projections keep year 1
+    peak_idx = int(np.argmax(projected)) if len(projected) else 0
+    peak_proj_value = float(projected[peak_idx]) if len(projected) else 0.0
+    peak_proj_season = current_season + 1 + peak_idx
 
     # Total remaining value (sum of projected values, normalized)
     career_value_remaining = sum(p.projected_value for p in trajectory_points)
@@ -173,46 +381,60 @@ def project_career_trajectory(
     )
 
 
-def _get_age_factor(age: int, aging_curve: dict[int, float]) -> float:
-    """Get aging curve factor for a given age, with interpolation."""
-    if age in aging_curve:
-        return aging_curve[age]
+def _age_factors(ages: np.ndarray, is_pitcher: np.ndarray) -> np.ndarray:
+    """Aging curve factors for an array of ages, broadcasting player type."""
+    return np.where(
+        is_pitcher,
+        _get_age_factor(ages, _PITCHER_CURVE),
+        _get_age_factor(ages, _BATTER_CURVE),
+    )
 
-    # Extrapolate for ages outside the curve
-    ages = sorted(aging_curve.keys())
-    if age < ages[0]:
-        return aging_curve[ages[0]] * 0.9  # Young and unproven
-    if age > ages[-1]:
-        return max(0.05, aging_curve[ages[-1]] * 0.5)  # Very old
 
-    # Linear interpolation
-    for i in range(len(ages) - 1):
-        if ages[i] <= age <= ages[i + 1]:
-            t = (age - ages[i]) / (ages[i + 1] - ages[i])
-            return aging_curve[ages[i]] * (1 - t) + aging_curve[ages[i + 1]] * t
+def _get_age_factor(
+    ages: np.ndarray, aging_curve: tuple[np.ndarray, np.ndarray]
+) -> np.ndarray:
+    """Get aging curve factors for an array of ages, with interpolation.
 
-    return 0.5  # Fallback
+    Args:
+        ages: Player ages (any shape).
+        aging_curve: (ages, factors) node arrays, ages sorted ascending.
+    """
+    curve_ages, values = aging_curve
+
+    # Linear interpolation between nodes (exact at integer ages)
+    factors = np.interp(ages, curve_ages, values).astype(np.float32)
+
+    # Extrapolate for ages outside the curve
+    factors = np.where(ages < curve_ages[0], values[0] * 0.9, factors)  # Young and unproven
+    factors = np.where(
+        ages > curve_ages[-1], max(0.05, values[-1] * 0.5), factors
+    )  # Very old
+    return factors
 
 
 def _improvement_adjustment(
-    improvement_score: float, current_age: int, peak_age: int
-) -> float:
+    improvement_score: np.ndarray, current_age: np.ndarray, peak_age: np.ndarray
+) -> np.ndarray:
     """Calculate peak value adjustment based on improvement trajectory.
 
     Improving young players may exceed their current-performance-based
     peak estimate. Declining players may fall short.
     """
-    if current_age > peak_age + 3:
-        # Post-peak: improvement is unlikely to raise the ceiling
-        return max(-0.15, improvement_score / 1000)
-
-    if improvement_score > 0:
-        # Pre-peak or near-peak with improvement: boost ceiling
-        age_trust = max(0.3, 1.0 - (current_age - 22) * 0.1)
-        return min(0.25, (improvement_score / 100) * 0.2 * age_trust)
-    else:
-        # Declining: reduce ceiling
-        return max(-0.20, (improvement_score / 100) * 0.15)
+    # Post-peak: improvement is unlikely to raise the ceiling
+    post_peak = np.maximum(-0.15, improvement_score / 1000)
+
+    # Pre-peak or near-peak with improvement: boost ceiling
+    age_trust = np.maximum(0.3, 1.0 - (current_age - 22).astype(np.float32) * 0.1)
+    improving = np.minimum(0.25, (improvement_score / 100) * 0.2 * age_trust)
+
+    # Declining: reduce ceiling
+    declining = np.maximum(-0.20, (improvement_score / 100) * 0.15)
+
+    return np.where(
+        current_age > peak_age + 3,
+        post_peak,
+        np.where(improvement_score > 0, improving, declining),
+    )
 
 
 def _grade_trajectory(
@@ -257,30 +479,65 @@ def batch_project_trajectories(
     Args:
         players: List of dicts with keys: player_id, age, current_value,
                  player_type, improvement_score, consistency_score, dynasty_value.
+                 Players without a numeric player_id are skipped with a warning.
         current_season: Current year.
         projection_years: Years to project forward.
 
     Returns:
         List of CareerTrajectory objects.
     """
-    results = []
-    for p in players:
-        try:
-            trajectory = project_career_trajectory(
-                player_id=p["player_id"],
-                current_age=p.get("age", 28),
-                current_value=p.get("current_value", 50),
-                player_type=p.get("player_type", "batter"),
-                improvement_score=p.get("improvement_score", 0),
-                consistency_score=p.get("consistency_score", 50),
-                dynasty_value=p.get("dynasty_value", 50),
-                projection_years=projection_years,
-                current_season=current_season,
-            )
-            results.append(trajectory)
-        except Exception as e:
-            logger.warning(f"Failed to project trajectory for player {p.get('player_id')}: {e}")
-            continue
+    if not players:
+        logger.info("Projected trajectories for 0 players")
+        return []
+
+    # One frame conversion up front; every field is then a column extract
+    df = pd.DataFrame(players).reindex(columns=list(_BATCH_DEFAULTS) + ["player_id"])
+    player_ids = pd.to_numeric(df["player_id"], errors="coerce")
+    bad_id = player_ids.isna()
+    if bad_id.any():
+        logger.warning(f"Skipping {int(bad_id.sum())} players without a valid player_id")
+        df = df[~bad_id]
+        player_ids = player_ids[~bad_id]
+
+    numeric = {
+        col: pd.to_numeric(df[col], errors="coerce").fillna(default).to_numpy(np.float64)
+        for col, default in _BATCH_DEFAULTS.items()
+        if col != "player_type"
+    }
+    # Ages stay fractional, exactly as project_career_trajectory receives them
+    ages = numeric["age"]
+    player_types = df["player_type"].fillna(_BATCH_DEFAULTS["player_type"]).to_numpy()
+    is_pitcher = player_types != "batter"
+    improvement = numeric["improvement_score"]
+
+    project = (
+        _project_value_matrix_parallel
+        if njit is not None and len(df) >= _PARALLEL_MIN_PLAYERS
+        else _project_value_matrix
+    )
+    projected, upper, lower = project(
+        current_ages=ages,
+        current_values=numeric["current_value"].astype(np.float32),
+        is_pitcher=is_pitcher,
+        improvement_scores=improvement.astype(np.float32),
+        consistency_scores=numeric["consistency_score"].astype(np.float32),
+        projection_years=projection_years,
+    )
+
+    results = [
+        _build_trajectory(
+            player_id=pid,
+            current_age=int(age) if age.is_integer() else age,
+            current_value=float(numeric["current_value"][i]),
+            peak_age=26 if is_pitcher[i] else 27,
+            improvement_score=float(improvement[i]),
+            projected=projected[i],
+            upper=upper[i],
+            lower=lower[i],
+            current_season=current_season,
+        )
+        for i, (pid, age) in enumerate(zip(player_ids.astype(np.int64).tolist(), ages.tolist()))
+    ]
 
     logger.info(f"Projected trajectories for {len(results)} players")
     return results
@@ -5,6 +5,7 @@ surplus value all factor into the final score. Integrates career trajectory
 projections for multi-season dynasty value.
 """
 
+import functools
 import logging
 
 import numpy as np
@@ -26,6 +27,16 @@ DEFAULT_WEIGHTS = {
     "trajectory_outlook": 0.12,   # Career trajectory model projection
 }
 
+
+def _normalize_weights(weights: dict[str, float]) -> dict[str, float]:
+    """Scale weights so they sum to 1."""
+    total_w = sum(weights.values())
+    return {k: v / total_w for k, v in weights.items()}
+
+
+# Default weights are constant, so normalize them once at import
+_DEFAULT_NORMALIZED = _normalize_weights(DEFAULT_WEIGHTS)
+
 BATTER_PEAK_AGE = 27
 PITCHER_PEAK_AGE = 26
 
@@ -35,6 +46,8 @@ def calculate_ai_value_scores(
     player_ages: dict[int, int],
     player_types: dict[int, str] | None = None,
     weights: dict[str, float] | None = None,
+    include_components: bool = True,
+    trajectory_outlook: bool = True,
 ) -> pd.DataFrame:
     """Calculate composite AI Value Score for all players.
 
@@ -50,83 +63,120 @@ def calculate_ai_value_scores(
         player_ages: Dict mapping player_id -> current age.
         player_types: Dict mapping player_id -> "batter" or "pitcher".
         weights: Custom weight overrides.
+        include_components: Whether to build the per-player value_components
+            breakdown. Callers that only need the score can skip it.
+        trajectory_outlook: Whether to include the career trajectory component.
+            When disabled its weight is dropped and the remaining weights are
+            renormalized, reproducing the pre-trajectory composite.
 
     Returns:
-        DataFrame with player_id and ai_value_score (0-100), plus component breakdown.
+        DataFrame with player_id and ai_value_score (0-100), plus the
+        value_components breakdown when include_components is set.
     """
-    w = {**DEFAULT_WEIGHTS, **(weights or {})}
-    # Normalize weights to sum to 1
-    total_w = sum(w.values())
-    w = {k: v / total_w for k, v in w.items()}
-
-    results = []
-    for _, row in scores_df.iterrows():
-        pid = row["player_id"]
-        age = player_ages.get(pid, 30)
-        ptype = (player_types or {}).get(pid, "batter")
-        peak_age = BATTER_PEAK_AGE if ptype == "batter" else PITCHER_PEAK_AGE
-
-        components = {}
-
-        # 1. Projected value (normalized from auction_value)
-        auction_val = row.get("auction_value", 0) or 0
-        # Scale: $40+ = 100, $1 = 10
-        components["projected_value"] = min(100, max(0, auction_val * 2.5))
-
+    w = _DEFAULT_NORMALIZED if weights is None else _normalize_weights(
+        {**DEFAULT_WEIGHTS, **weights}
+    )
+    if not trajectory_outlook:
+        w = _normalize_weights({k: v for k, v in w.items() if k != "trajectory_outlook"})
+
+    ids_arr = scores_df["player_id"].to_numpy()
+
+    # One pass over each lookup dict, gathered straight into typed arrays
+    pids = ids_arr.tolist()
+    types = player_types or {}
+    ages = np.fromiter((player_ages.get(pid, 30) for pid in pids), dtype=np.int16, count=len(pids))
+    is_pitcher = np.fromiter(
+        (types.get(pid, "batter") != "batter" for pid in pids), dtype=np.bool_, count=len(pids)
+    )
+    peak_ages = np.where(is_pitcher, PITCHER_PEAK_AGE, BATTER_PEAK_AGE).astype(np.int16)
+
+    auction_val = _score_column(scores_df, "auction_value", 0)
+    improvement = _score_column(scores_df, "improvement_score", 0)
+    dynasty = _score_column(scores_df, "dynasty_value", 0)
+
+    components = {
+        # 1. Projected value (normalized from auction_value). Scale: $40+ = 100, $1 = 10
+        "projected_value": np.clip(auction_val * 2.5, 0, 100),
         # 2. Sleeper upside
-        sleeper = row.get("sleeper_score", 0) or 0
-        components["sleeper_upside"] = sleeper
-
+        "sleeper_upside": _score_column(scores_df, "sleeper_score", 0),
         # 3. Bust safety (inverse of bust score)
-        bust = row.get("bust_score", 0) or 0
-        components["bust_safety"] = 100 - bust
-
-        # 4. Consistency
-        consistency = row.get("consistency_score") or 50  # Default to neutral
-        components["consistency"] = consistency
-
+        "bust_safety": 100 - _score_column(scores_df, "bust_score", 0),
+        # 4. Consistency (default to neutral)
+        "consistency": _score_column(scores_df, "consistency_score", 50),
         # 5. Age curve factor
-        components["age_curve"] = _age_curve_score(age, peak_age)
-
+        "age_curve": np.array(
+            [_age_curve_score(a, pk) for a, pk in zip(ages.tolist(), peak_ages.tolist())],
+            dtype=np.float32,
+        ),
         # 6. Dynasty premium
-        dynasty = row.get("dynasty_value", 0) or 0
-        components["dynasty_premium"] = dynasty
-
+        "dynasty_premium": dynasty,
         # 7. Improvement score (rescale from -100..100 to 0..100)
-        improvement = row.get("improvement_score", 0) or 0
-        components["improvement"] = min(100, max(0, (improvement + 100) / 2))
-
+        "improvement": np.clip((improvement + 100) / 2, 0, 100),
         # 8. Opportunity (playing time proxy from auction value ranking)
-        components["opportunity"] = min(100, max(0, auction_val * 3))
-
-        # 9. Trajectory outlook (from career trajectory model)
-        components["trajectory_outlook"] = _trajectory_outlook_score(
-            age, peak_age, improvement, dynasty
+        "opportunity": np.clip(auction_val * 3, 0, 100),
+    }
+
+    # 9. Trajectory outlook (from career trajectory model)
+    if trajectory_outlook:
+        components["trajectory_outlook"] = np.array(
+            [
+                _trajectory_outlook_score(a, pk, imp, dyn)
+                for a, pk, imp, dyn in zip(
+                    ages.tolist(), peak_ages.tolist(), improvement.tolist(), dynasty.tolist()
+                )
+            ],
+            dtype=np.float32,
         )
 
-        # Weighted combination
-        ai_value = sum(w[k] * components[k] for k in w if k in components)
-        ai_value = round(max(0, min(100, ai_value)), 1)
-
-        results.append({
-            "player_id": pid,
-            "ai_value_score": ai_value,
-            "value_components": {k: round(v, 1) for k, v in components.items()},
-        })
-
-    result_df = pd.DataFrame(results)
+    # Weighted combination, clipped once at the end
+    components_matrix = np.column_stack(list(components.values()))
+    wvec = np.array([w.get(k, 0.0) for k in components], dtype=np.float32)
+    scores_arr = np.clip(components_matrix @ wvec, 0, 100)
+    np.round(scores_arr, 1, out=scores_arr)
+
+    result_df = pd.DataFrame({"player_id": ids_arr, "ai_value_score": scores_arr})
+    if include_components:
+        # Round the whole matrix in one pass; widen first so the emitted
+        # Python floats carry no float32 representation noise
+        rounded = np.round(components_matrix.astype(np.float64), 1)
+        component_names = list(components)
+        result_df["value_components"] = [
+            dict(zip(component_names, row)) for row in rounded.tolist()
+        ]
     logger.info(f"Calculated AI Value Scores for {len(result_df)} players")
     return result_df
 
 
+def _score_column(scores_df: pd.DataFrame, name: str, default: float) -> np.ndarray:
+    """Extract a numeric score column, substituting the default for missing/NaN/zero.
+
+    Zero falls back to the default as ``row.get(name) or default`` did. Unlike
+    that form, NaN (which is truthy) is also treated as missing, so an unscored
+    input no longer turns the player's ai_value_score into NaN.
+    """
+    if name not in scores_df.columns:
+        return np.full(len(scores_df), default, dtype=np.float32)
+    values = pd.to_numeric(scores_df[name], errors="coerce").to_numpy(dtype=np.float32)
+    return np.where(np.isnan(values) | (values == 0), default, values)
+
+
 def _trajectory_outlook_score(
     age: int, peak_age: int, improvement: float, dynasty: float
 ) -> float:
     """Score combining trajectory model signals (0-100).
 
     Blends the career trajectory outlook with improvement momentum and
-    dynasty value for a forward-looking assessment.
+    dynasty value for a forward-looking assessment. Scores are quantized to
+    0.1 (the precision the upstream models report) so repeated inputs across
+    a roster hit the cache.
     """
+    return _trajectory_outlook_cached(age, peak_age, round(improvement, 1), round(dynasty, 1))
+
+
+@functools.lru_cache(maxsize=4096)
+def _trajectory_outlook_cached(
+    age: int, peak_age: int, improvement: float, dynasty: float
+) -> float:
     # Base: dynasty value already captures multi-year outlook
     base = dynasty * 0.5
 
@@ -149,6 +199,7 @@ def _trajectory_outlook_score(
     return max(0, min(100, base))
 
 
+@functools.lru_cache(maxsize=256)
 def _age_curve_score(age: int, peak_age: int) -> float:
     """Score based on position on the age curve (0-100).
 
@@ -0,0 +1,48 @@
+"""Shared fixtures for the LLM formatter tests."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+LEAGUE_SIZE = 500
+
+
+@pytest.fixture(scope="session")
+def league_batting_df() -> pd.DataFrame:
+    """A league-sized frame of batters: bio, latest-season stats and model scores."""
+    rng = np.random.default_rng(0)
+    n = LEAGUE_SIZE
+    return pd.DataFrame({
+        "player_id": np.arange(n),
+        "full_name": [f"Batter {i}" for i in range(n)],
+        "age": rng.integers(20, 39, n),
+        "team": rng.choice(["NYY", "LAD", "HOU", "ATL", "SEA"], n),
+        "position": rng.choice(["C", "1B", "2B", "SS", "3B", "OF"], n),
+        "season": 2023,
+        "pa": rng.integers(150, 700, n),
+        "avg": rng.uniform(0.200, 0.320, n),
+        "obp": rng.uniform(0.270, 0.420, n),
+        "slg": rng.uniform(0.330, 0.600, n),
+        "woba": rng.uniform(0.280, 0.420, n),
+        "xwoba": rng.uniform(0.280, 0.420, n),
+        "wrc_plus": rng.integers(60, 180, n),
+        "iso": rng.uniform(0.080, 0.300, n),
+        "babip": rng.uniform(0.250, 0.360, n),
+        "k_pct": rng.uniform(0.10, 0.35, n),
+        "bb_pct": rng.uniform(0.04, 0.16, n),
+        "barrel_pct": rng.uniform(0.02, 0.20, n),
+        "hard_hit_pct": rng.uniform(0.28, 0.55, n),
+        "avg_exit_velocity": rng.uniform(85.0, 95.0, n),
+        "sprint_speed": rng.uniform(24.0, 30.0, n),
+        "war": rng.uniform(-1.0, 8.0, n),
+        "ai_value_score": rng.uniform(0, 100, n),
+        "sleeper_score": rng.uniform(0, 100, n),
+        "bust_score": rng.uniform(0, 100, n),
+        "consistency_score": rng.uniform(0, 100, n),
+        "improvement_score": rng.uniform(-100, 100, n),
+        "regression_direction": rng.uniform(-0.05, 0.05, n),
+        "auction_value": rng.uniform(1, 45, n),
+        "dynasty_value": rng.uniform(0, 100, n),
+        "surplus_value": rng.uniform(-15, 15, n),
+        "expected_cost": rng.uniform(1, 45, n),
+    })
@@ -1,8 +1,15 @@
 """Tests for the scouting report cache manager."""
 
+import numpy as np
 import pytest
 
-from backend.llm.generators.cache_manager import is_report_stale, select_batch_players
+from backend.llm.generators import cache_manager
+from backend.llm.generators.cache_manager import (
+    _top_k_indices,
+    is_report_stale,
+    is_report_stale_batch,
+    select_batch_players,
+)
 
 
 class TestStalenessDetection:
@@ -40,6 +47,36 @@ class TestStalenessDetection:
         current = {"regression_direction": -0.05}
         assert is_report_stale(snapshot, current) is True
 
+    def test_batch_matches_scalar(self):
+        """Batch staleness should agree with the per-player check."""
+        snapshots = [
+            None,
+            {"sleeper_score": 60, "bust_score": 30, "ai_value_score": 75},
+            {"sleeper_score": 60, "bust_score": 30, "ai_value_score": 75},
+            {"auction_value": 25.0, "dynasty_value": None},
+            {"regression_direction": 0.05},
+            {"regression_direction": 0.005},
+        ]
+        currents = [
+            {"sleeper_score": 50},
+            {"sleeper_score": 62, "bust_score": 28, "ai_value_score": 76},
+            {"sleeper_score": 75, "bust_score": 30, "ai_value_score": 75},
+            {"auction_value": 35.0, "dynasty_value": 40.0},
+            {"regression_direction": -0.05},
+            {"regression_direction": -0.005},
+        ]
+        expected = [is_report_stale(s, c) for s, c in zip(snapshots, currents)]
+        assert is_report_stale_batch(snapshots, currents).tolist() == expected
+
+
+_RNG = np.random.default_rng(7)
+_TOP_K_INPUTS = {
+    "bounded": _RNG.uniform(0, 100, 500),
+    "bounded_ties": _RNG.integers(0, 101, 500).astype(float),
+    "unbounded": _RNG.normal(50, 40, 500),
+    "unbounded_ties": _RNG.integers(-50, 150, 500).astype(float),
+}
+
 
 class TestBatchPlayerSelection:
     def test_selects_top_value_players(self):
@@ -74,3 +111,23 @@ class TestBatchPlayerSelection:
 
         assert "full" in result[1]
         assert "sleeper_spotlight" in result[1]
+
+    @pytest.mark.parametrize("k, expected", [(2, [0, 2]), (3, [0, 2, 3]), (5, [0, 2, 3, 5, 1])])
+    def test_nan_scores_rank_last(self, k, expected):
+        """NaN scores should sort below real scores without shrinking the selection."""
+        values = np.array([50.0, np.nan, 40.0, 30.0, np.nan, 20.0])
+
+        assert _top_k_indices(values, k).tolist() == expected
+
+    @pytest.mark.parametrize("force_partition", [False, True], ids=["default", "partition"])
+    @pytest.mark.parametrize("k", [1, 25, 250, 499, 500, 600])
+    @pytest.mark.parametrize("name", list(_TOP_K_INPUTS))
+    def test_top_k_matches_stable_sort(self, monkeypatch, name, k, force_partition):
+        """Both selection paths should match a stable descending sort cut to k."""
+        values = _TOP_K_INPUTS[name]
+        if force_partition:
+            # No score fits below a negative scale cap, so the bucket path is skipped
+            monkeypatch.setattr(cache_manager, "SCORE_MAX", -1)
+        expected = sorted(range(len(values)), key=values.__getitem__, reverse=True)[:k]
+
+        assert _top_k_indices(values, k).tolist() == expected
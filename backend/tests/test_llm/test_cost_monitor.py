@@ -1,7 +1,10 @@
 """Tests for the scouting report cost monitor."""
 
+from types import SimpleNamespace
+
 import pytest
 
+from backend.llm.generators import cost_monitor
 from backend.llm.generators.cost_monitor import CostMonitor
 
 
@@ -23,6 +26,17 @@ class TestCostMonitor:
         assert allowed is False
         assert "Concurrent" in reason
 
+    def test_start_refused_at_concurrent_limit(self):
+        """record_start should not admit more than max_concurrent requests."""
+        monitor = CostMonitor(max_concurrent=1)
+        assert monitor.record_start() is True
+        assert monitor.record_start() is False
+        assert monitor._active_requests == 1
+
+        monitor.record_completion()
+        monitor.record_failure()  # nothing in flight; must not go negative
+        assert monitor._active_requests == 0
+
     def test_blocks_when_hourly_limit_reached(self):
         """Should block when hourly limit is exceeded."""
         monitor = CostMonitor(max_per_hour=3, max_per_day=100, max_concurrent=10)
@@ -35,6 +49,20 @@ class TestCostMonitor:
         assert allowed is False
         assert "Hourly" in reason
 
+    def test_hourly_limit_refills_over_time(self, monkeypatch):
+        """Spent hourly capacity should come back as time passes."""
+        clock = [1000.0]
+        monkeypatch.setattr(cost_monitor, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+        monitor = CostMonitor(max_per_hour=3, max_per_day=100, max_concurrent=10)
+        for _ in range(3):
+            monitor.record_start()
+            monitor.record_completion()
+        assert monitor.can_generate()[0] is False
+
+        clock[0] += 1200  # one report's worth of refill at 3/hr
+        assert monitor.can_generate() == (True, "")
+        assert monitor.get_stats()["hourly_count"] == 2
+
     def test_completion_decrements_active(self):
         """record_completion should decrement active request count."""
         monitor = CostMonitor(max_concurrent=2)
@@ -0,0 +1,349 @@
+"""Shared DataFrame fixtures for the ML model tests.
+
+Scenario frames are built once per module; the code under test treats its
+input as read-only, so tests receive the shared frame directly. Scenarios
+that need player ages are returned as (frame, ages) pairs.
+"""
+
+from itertools import chain
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def _make_seasons_df(player_data: dict) -> pd.DataFrame:
+    """Helper to create a season-stats DataFrame from {player_id: [season dicts]}."""
+    df = pd.DataFrame(list(chain.from_iterable(player_data.values())))
+    pids = np.repeat(list(player_data), [len(s) for s in player_data.values()])
+    df.insert(0, "player_id", pids)
+    return df
+
+
+# ---- Consistency scenarios ----
+
+
+@pytest.fixture(scope="module")
+def consistent_batter_df() -> pd.DataFrame:
+    """Batter with nearly identical stats across 3 seasons."""
+    return _make_seasons_df({
+        1: [
+            {"season": 2023, "pa": 600, "k_pct": 0.20, "bb_pct": 0.10, "iso": 0.200,
+             "barrel_pct": 0.10, "avg_exit_velocity": 90.0, "hard_hit_pct": 0.40,
+             "gb_pct": 0.45, "fb_pct": 0.35, "woba": 0.350, "wrc_plus": 120,
+             "sprint_speed": 27.0},
+            {"season": 2022, "pa": 580, "k_pct": 0.21, "bb_pct": 0.10, "iso": 0.195,
+             "barrel_pct": 0.10, "avg_exit_velocity": 89.8, "hard_hit_pct": 0.39,
+             "gb_pct": 0.44, "fb_pct": 0.36, "woba": 0.345, "wrc_plus": 118,
+             "sprint_speed": 27.1},
+            {"season": 2021, "pa": 590, "k_pct": 0.20, "bb_pct": 0.09, "iso": 0.205,
+             "barrel_pct": 0.11, "avg_exit_velocity": 90.2, "hard_hit_pct": 0.41,
+             "gb_pct": 0.45, "fb_pct": 0.34, "woba": 0.355, "wrc_plus": 122,
+             "sprint_speed": 27.2},
+        ],
+    })
+
+
+@pytest.fixture(scope="module")
+def volatile_batter_df() -> pd.DataFrame:
+    """Batter with wildly different stats across 3 seasons."""
+    return _make_seasons_df({
+        2: [
+            {"season": 2023, "pa": 500, "k_pct": 0.30, "bb_pct": 0.05, "iso": 0.100,
+             "barrel_pct": 0.04, "avg_exit_velocity": 85.0, "hard_hit_pct": 0.30,
+             "gb_pct": 0.50, "fb_pct": 0.30, "woba": 0.280, "wrc_plus": 80,
+             "sprint_speed": 26.0},
+            {"season": 2022, "pa": 500, "k_pct": 0.15, "bb_pct": 0.12, "iso": 0.250,
+             "barrel_pct": 0.14, "avg_exit_velocity": 92.0, "hard_hit_pct": 0.48,
+             "gb_pct": 0.35, "fb_pct": 0.45, "woba": 0.380, "wrc_plus": 140,
+             "sprint_speed": 27.5},
+            {"season": 2021, "pa": 400, "k_pct": 0.25, "bb_pct": 0.08, "iso": 0.170,
+             "barrel_pct": 0.09, "avg_exit_velocity": 88.0, "hard_hit_pct": 0.38,
+             "gb_pct": 0.42, "fb_pct": 0.38, "woba": 0.320, "wrc_plus": 105,
+             "sprint_speed": 26.8},
+        ],
+    })
+
+
+@pytest.fixture(scope="module")
+def single_season_batter_df() -> pd.DataFrame:
+    """Batter with only one season on record."""
+    return _make_seasons_df({
+        3: [{"season": 2023, "pa": 600, "k_pct": 0.20, "bb_pct": 0.10, "iso": 0.200}],
+    })
+
+
+@pytest.fixture(scope="module")
+def low_pa_season_batter_df() -> pd.DataFrame:
+    """Batter whose middle season falls below the PA threshold."""
+    return _make_seasons_df({
+        4: [
+            {"season": 2023, "pa": 600, "k_pct": 0.20, "bb_pct": 0.10, "iso": 0.200},
+            {"season": 2022, "pa": 50, "k_pct": 0.30, "bb_pct": 0.05, "iso": 0.100},
+            {"season": 2021, "pa": 580, "k_pct": 0.21, "bb_pct": 0.09, "iso": 0.195},
+        ],
+    })
+
+
+@pytest.fixture(scope="module")
+def two_season_batter_df() -> pd.DataFrame:
+    """Batter with exactly two qualifying seasons."""
+    return _make_seasons_df({
+        5: [
+            {"season": 2023, "pa": 600, "k_pct": 0.20, "bb_pct": 0.10, "iso": 0.200},
+            {"season": 2022, "pa": 580, "k_pct": 0.21, "bb_pct": 0.10, "iso": 0.195},
+        ],
+    })
+
+
+@pytest.fixture(scope="module")
+def consistent_pitcher_df() -> pd.DataFrame:
+    """Pitcher with steady peripherals across 3 seasons."""
+    return _make_seasons_df({
+        10: [
+            {"season": 2023, "ip": 180, "k_pct": 0.28, "k_bb_pct": 0.20,
+             "swstr_pct": 0.12, "csw_pct": 0.30, "gb_pct": 0.45,
+             "fip": 3.20, "siera": 3.30, "xera": 3.40, "stuff_plus": 110},
+            {"season": 2022, "ip": 175, "k_pct": 0.27, "k_bb_pct": 0.19,
+             "swstr_pct": 0.12, "csw_pct": 0.30, "gb_pct": 0.44,
+             "fip": 3.30, "siera": 3.40, "xera": 3.50, "stuff_plus": 108},
+            {"season": 2021, "ip": 170, "k_pct": 0.27, "k_bb_pct": 0.19,
+             "swstr_pct": 0.11, "csw_pct": 0.29, "gb_pct": 0.46,
+             "fip": 3.25, "siera": 3.35, "xera": 3.45, "stuff_plus": 109},
+        ],
+    })
+
+
+# ---- Feature engineering scenarios ----
+
+
+@pytest.fixture(scope="module")
+def differential_batting_df() -> pd.DataFrame:
+    """Single batter season with actual and expected stats."""
+    return pd.DataFrame([
+        {"player_id": 1, "season": 2023, "pa": 600,
+         "woba": 0.350, "xwoba": 0.320, "avg": 0.280, "xba": 0.260,
+         "slg": 0.450, "xslg": 0.420, "babip": 0.320,
+         "k_pct": 0.20, "bb_pct": 0.10, "barrel_pct": 0.10},
+    ])
+
+
+@pytest.fixture(scope="module")
+def two_year_batting_df() -> pd.DataFrame:
+    """Two consecutive batter seasons for year-over-year deltas."""
+    return pd.DataFrame([
+        {"player_id": 1, "season": 2023, "pa": 600,
+         "k_pct": 0.18, "bb_pct": 0.12, "barrel_pct": 0.14},
+        {"player_id": 1, "season": 2022, "pa": 550,
+         "k_pct": 0.22, "bb_pct": 0.10, "barrel_pct": 0.10},
+    ])
+
+
+@pytest.fixture(scope="module")
+def age_bucket_batting_df() -> pd.DataFrame:
+    """One season each for three batters of different ages."""
+    return pd.DataFrame([
+        {"player_id": 1, "season": 2023, "pa": 600, "k_pct": 0.20},
+        {"player_id": 2, "season": 2023, "pa": 600, "k_pct": 0.20},
+        {"player_id": 3, "season": 2023, "pa": 600, "k_pct": 0.20},
+    ])
+
+
+@pytest.fixture(scope="module")
+def trending_batting_df() -> pd.DataFrame:
+    """Three seasons of steadily rising barrel rate."""
+    return pd.DataFrame([
+        {"player_id": 1, "season": 2023, "pa": 600, "barrel_pct": 0.14},
+        {"player_id": 1, "season": 2022, "pa": 550, "barrel_pct": 0.10},
+        {"player_id": 1, "season": 2021, "pa": 500, "barrel_pct": 0.06},
+    ])
+
+
+@pytest.fixture(scope="module")
+def single_batting_season_df() -> pd.DataFrame:
+    """Minimal single batter season."""
+    return pd.DataFrame([{"player_id": 1, "season": 2023, "pa": 600, "k_pct": 0.20}])
+
+
+@pytest.fixture(scope="module")
+def differential_pitching_df() -> pd.DataFrame:
+    """Single starter season with ERA estimators."""
+    return pd.DataFrame([{
+        "player_id": 10, "season": 2023, "ip": 180, "gs": 30,
+        "era": 3.50, "fip": 3.80, "xera": 3.60, "xfip": 3.70,
+        "babip": 0.280, "lob_pct": 0.78, "hr_fb_pct": 0.10,
+        "k_pct": 0.28, "bb_pct": 0.07, "k_bb_pct": 0.21,
+        "swstr_pct": 0.12, "csw_pct": 0.30,
+    }])
+
+
+# ---- Improvement scenarios ----
+
+
+@pytest.fixture(scope="module")
+def improving_young_df_and_ages() -> tuple[pd.DataFrame, dict[int, int]]:
+    """25-year-old batter improving steadily across three seasons."""
+    return _make_seasons_df({
+        1: [
+            {"season": 2023, "pa": 600, "k_pct": 0.18, "bb_pct": 0.12,
+             "barrel_pct": 0.14, "hard_hit_pct": 0.45, "avg_exit_velocity": 92.0,
+             "sprint_speed": 28.0},
+            {"season": 2022, "pa": 550, "k_pct": 0.22, "bb_pct": 0.10,
+             "barrel_pct": 0.10, "hard_hit_pct": 0.40, "avg_exit_velocity": 90.0,
+             "sprint_speed": 27.8},
+            {"season": 2021, "pa": 400, "k_pct": 0.26, "bb_pct": 0.08,
+             "barrel_pct": 0.07, "hard_hit_pct": 0.35, "avg_exit_velocity": 88.0,
+             "sprint_speed": 27.5},
+        ],
+    }), {1: 25}
+
+
+@pytest.fixture(scope="module")
+def declining_old_df_and_ages() -> tuple[pd.DataFrame, dict[int, int]]:
+    """35-year-old batter whose skills decline every season."""
+    return _make_seasons_df({
+        2: [
+            {"season": 2023, "pa": 500, "k_pct": 0.28, "bb_pct": 0.06,
+             "barrel_pct": 0.05, "hard_hit_pct": 0.30, "avg_exit_velocity": 86.0,
+             "sprint_speed": 25.0},
+            {"season": 2022, "pa": 550, "k_pct": 0.24, "bb_pct": 0.08,
+             "barrel_pct": 0.08, "hard_hit_pct": 0.35, "avg_exit_velocity": 88.0,
+             "sprint_speed": 26.0},
+            {"season": 2021, "pa": 600, "k_pct": 0.20, "bb_pct": 0.10,
+             "barrel_pct": 0.11, "hard_hit_pct": 0.40, "avg_exit_velocity": 90.0,
+             "sprint_speed": 27.0},
+        ],
+    }), {2: 35}
+
+
+@pytest.fixture(scope="module")
+def flat_df_and_ages() -> tuple[pd.DataFrame, dict[int, int]]:
+    """28-year-old batter with identical skills stats every season."""
+    return _make_seasons_df({
+        3: [
+            {"season": 2023, "pa": 600, "k_pct": 0.22, "bb_pct": 0.09,
+             "barrel_pct": 0.10, "hard_hit_pct": 0.38, "avg_exit_velocity": 89.5,
+             "sprint_speed": 27.0},
+            {"season": 2022, "pa": 580, "k_pct": 0.22, "bb_pct": 0.09,
+             "barrel_pct": 0.10, "hard_hit_pct": 0.38, "avg_exit_velocity": 89.5,
+             "sprint_speed": 27.0},
+            {"season": 2021, "pa": 590, "k_pct": 0.22, "bb_pct": 0.09,
+             "barrel_pct": 0.10, "hard_hit_pct": 0.38, "avg_exit_velocity": 89.5,
+             "sprint_speed": 27.0},
+        ],
+    }), {3: 28}
+
+
+@pytest.fixture(scope="module")
+def single_season_improvement_df_and_ages() -> tuple[pd.DataFrame, dict[int, int]]:
+    """Batter with only one season, too few for a trend."""
+    return _make_seasons_df({
+        5: [{"season": 2023, "pa": 600, "k_pct": 0.20, "bb_pct": 0.10}],
+    }), {5: 28}
+
+
+@pytest.fixture(scope="module")
+def two_season_improvement_df_and_ages() -> tuple[pd.DataFrame, dict[int, int]]:
+    """25-year-old batter with two improving seasons, the shortest history that gets a trend."""
+    return _make_seasons_df({
+        6: [
+            {"season": 2023, "pa": 600, "k_pct": 0.18, "bb_pct": 0.12,
+             "barrel_pct": 0.14, "hard_hit_pct": 0.45, "avg_exit_velocity": 92.0,
+             "sprint_speed": 28.0},
+            {"season": 2022, "pa": 550, "k_pct": 0.22, "bb_pct": 0.10,
+             "barrel_pct": 0.10, "hard_hit_pct": 0.40, "avg_exit_velocity": 90.0,
+             "sprint_speed": 27.8},
+        ],
+    }), {6: 25}
+
+
+@pytest.fixture(scope="module")
+def improving_pitcher_df_and_ages() -> tuple[pd.DataFrame, dict[int, int]]:
+    """25-year-old pitcher with rising strikeout and swinging-strike rates."""
+    return _make_seasons_df({
+        10: [
+            {"season": 2023, "ip": 180, "k_pct": 0.30, "bb_pct": 0.06,
+             "k_bb_pct": 0.24, "swstr_pct": 0.14, "csw_pct": 0.32, "gb_pct": 0.48},
+            {"season": 2022, "ip": 170, "k_pct": 0.26, "bb_pct": 0.07,
+             "k_bb_pct": 0.19, "swstr_pct": 0.12, "csw_pct": 0.30, "gb_pct": 0.46},
+            {"season": 2021, "ip": 160, "k_pct": 0.22, "bb_pct": 0.08,
+             "k_bb_pct": 0.14, "swstr_pct": 0.10, "csw_pct": 0.28, "gb_pct": 0.44},
+        ],
+    }), {10: 25}
+
+
+# ---- AI value scenarios ----
+
+# Declared up front so score frames skip per-column dtype inference
+_SCORE_DTYPES = {
+    "player_id": "int64",
+    "sleeper_score": "float64",
+    "bust_score": "float64",
+    "regression_direction": "float64",
+    "consistency_score": "float64",
+    "improvement_score": "float64",
+    "auction_value": "float64",
+    "dynasty_value": "float64",
+    "surplus_value": "float64",
+}
+
+
+def _make_scores_df(players: list[dict]) -> pd.DataFrame:
+    """Helper to create a model-scores DataFrame with the declared dtypes."""
+    df = pd.DataFrame.from_records(players)
+    return df.astype({col: _SCORE_DTYPES[col] for col in df.columns})
+
+
+@pytest.fixture(scope="module")
+def high_value_df_and_ages() -> tuple[pd.DataFrame, dict[int, int]]:
+    """25-year-old with strong scores across every model."""
+    return _make_scores_df([{
+        "player_id": 1,
+        "sleeper_score": 80.0,
+        "bust_score": 10.0,
+        "regression_direction": 0.02,
+        "consistency_score": 85.0,
+        "improvement_score": 50.0,
+        "auction_value": 35.0,
+        "dynasty_value": 90.0,
+        "surplus_value": 10.0,
+    }]), {1: 25}
+
+
+@pytest.fixture(scope="module")
+def bust_risk_df_and_ages() -> tuple[pd.DataFrame, dict[int, int]]:
+    """34-year-old with high bust risk and declining skills."""
+    return _make_scores_df([{
+        "player_id": 2,
+        "sleeper_score": 20.0,
+        "bust_score": 85.0,
+        "regression_direction": -0.03,
+        "consistency_score": 30.0,
+        "improvement_score": -40.0,
+        "auction_value": 25.0,
+        "dynasty_value": 20.0,
+        "surplus_value": -5.0,
+    }]), {2: 34}
+
+
+@pytest.fixture(scope="module")
+def extreme_scores_df_and_ages() -> tuple[pd.DataFrame, dict[int, int]]:
+    """Two players pinned at opposite ends of every model score."""
+    return _make_scores_df([
+        {"player_id": 1, "sleeper_score": 100, "bust_score": 0,
+         "consistency_score": 100, "improvement_score": 100,
+         "auction_value": 50, "dynasty_value": 100},
+        {"player_id": 2, "sleeper_score": 0, "bust_score": 100,
+         "consistency_score": 0, "improvement_score": -100,
+         "auction_value": 1, "dynasty_value": 0},
+    ]), {1: 24, 2: 38}
+
+
+@pytest.fixture(scope="module")
+def peak_age_df_and_ages() -> tuple[pd.DataFrame, dict[int, int]]:
+    """27-year-old with moderately good scores."""
+    return _make_scores_df([{
+        "player_id": 1, "sleeper_score": 60, "bust_score": 30,
+        "consistency_score": 70, "improvement_score": 20,
+        "auction_value": 25, "dynasty_value": 60,
+    }]), {1: 27}
@@ -1,130 +1,165 @@
 """Tests for the career trajectory model."""
 
+import numpy as np
 import pytest
 
+from backend.ml.models import trajectory_model
 from backend.ml.models.trajectory_model import (
     CareerTrajectory,
+    _project_value_matrix,
     batch_project_trajectories,
     project_career_trajectory,
 )
+from backend.tests.test_ml.trajectory_checks import check_trajectory_bounds
+
+# One entry per scenario below; all are projected together by the trajectories fixture
+_SCENARIOS = (
+    {"player_id": 1, "age": 23, "current_value": 55, "player_type": "batter",
+     "improvement_score": 60, "consistency_score": 70, "dynasty_value": 80},
+    {"player_id": 2, "age": 27, "current_value": 85, "player_type": "batter",
+     "improvement_score": 5, "consistency_score": 80, "dynasty_value": 70},
+    {"player_id": 3, "age": 35, "current_value": 60, "player_type": "batter",
+     "improvement_score": -30, "consistency_score": 65, "dynasty_value": 25},
+    {"player_id": 4, "age": 26, "current_value": 70, "player_type": "batter"},
+    {"player_id": 5, "age": 28, "current_value": 70, "consistency_score": 90},
+    {"player_id": 6, "age": 28, "current_value": 70, "consistency_score": 30},
+    {"player_id": 7, "age": 24, "current_value": 95, "improvement_score": 80},
+    {"player_id": 10, "age": 25, "current_value": 70, "player_type": "batter"},
+    {"player_id": 11, "age": 25, "current_value": 70, "player_type": "pitcher"},
+    {"player_id": 20, "age": 22, "current_value": 40, "improvement_score": 50},
+    {"player_id": 21, "age": 27, "current_value": 80, "improvement_score": 15},
+    {"player_id": 22, "age": 36, "current_value": 40, "improvement_score": -20},
+)
+
+
+@pytest.fixture(scope="module")
+def trajectories() -> dict[int, CareerTrajectory]:
+    """Every scenario projected in one batch call, keyed by player_id."""
+    return {t.player_id: t for t in batch_project_trajectories(list(_SCENARIOS))}
 
 
 class TestBatterTrajectory:
     """Test career trajectory projections for batters."""
 
-    def test_young_rising_player(self):
+    def test_young_rising_player(self, trajectories):
         """A young improving player should have a rising trajectory."""
-        result = project_career_trajectory(
-            player_id=1,
-            current_age=23,
-            current_value=55,
-            player_type="batter",
-            improvement_score=60,
-            consistency_score=70,
-            dynasty_value=80,
-        )
+        result = trajectories[1]
         assert isinstance(result, CareerTrajectory)
         assert result.trajectory_grade == "Rising"
         # Young improving players should project higher in the near future
         assert result.peak_value >= result.current_value
         assert len(result.trajectory) == 6  # Default 6 years
 
-    def test_peak_age_player(self):
+    def test_peak_age_player(self, trajectories):
         """A peak-age player should plateau then decline."""
-        result = project_career_trajectory(
-            player_id=2,
-            current_age=27,
-            current_value=85,
-            player_type="batter",
-            improvement_score=5,
-            consistency_score=80,
-            dynasty_value=70,
-        )
+        result = trajectories[2]
         assert result.trajectory_grade == "Peak"
         # Should start declining after peak
         last_point = result.trajectory[-1]
         assert last_point.projected_value < result.current_value
 
-    def test_declining_old_player(self):
+    def test_declining_old_player(self, trajectories):
         """An old declining player should have a falling trajectory."""
-        result = project_career_trajectory(
-            player_id=3,
-            current_age=35,
-            current_value=60,
-            player_type="batter",
-            improvement_score=-30,
-            consistency_score=65,
-            dynasty_value=25,
-        )
+        result = trajectories[3]
         assert result.trajectory_grade in ("Declining", "Late Career")
         # Each year should be lower
-        values = [p.projected_value for p in result.trajectory]
-        for i in range(1, len(values)):
-            assert values[i] <= values[i - 1] + 1  # Allow tiny float tolerance
+        values = np.fromiter(
+            (p.projected_value for p in result.trajectory),
+            dtype=np.float64, count=len(result.trajectory),
+        )
+        assert np.all(np.diff(values) <= 1)  # Allow tiny float tolerance
 
-    def test_confidence_bands_widen(self):
+    def test_confidence_bands_widen(self, trajectories):
         """Confidence bands should be wider further into the future."""
-        result = project_career_trajectory(
-            player_id=4,
-            current_age=26,
-            current_value=70,
-            player_type="batter",
-        )
-        bandwidths = [
-            p.upper_bound - p.lower_bound for p in result.trajectory
-        ]
+        points = trajectories[4].trajectory
+        upper = np.fromiter((p.upper_bound for p in points), dtype=np.float64, count=len(points))
+        lower = np.fromiter((p.lower_bound for p in points), dtype=np.float64, count=len(points))
         # Each subsequent year should have equal or wider bands
-        for i in range(1, len(bandwidths)):
-            assert bandwidths[i] >= bandwidths[i - 1] - 0.5  # Allow tiny tolerance
+        assert np.all(np.diff(upper - lower) >= -0.5)  # Allow tiny tolerance
 
-    def test_inconsistent_player_wider_bands(self):
+    def test_inconsistent_player_wider_bands(self, trajectories):
         """Players with low consistency should have wider confidence bands."""
-        consistent = project_career_trajectory(
-            player_id=5, current_age=28, current_value=70,
-            consistency_score=90,
-        )
-        volatile = project_career_trajectory(
-            player_id=6, current_age=28, current_value=70,
-            consistency_score=30,
-        )
+        consistent, volatile = trajectories[5], trajectories[6]
         # Volatile player should have wider bands at same projection year
         c_band = consistent.trajectory[2].upper_bound - consistent.trajectory[2].lower_bound
         v_band = volatile.trajectory[2].upper_bound - volatile.trajectory[2].lower_bound
         assert v_band > c_band
 
-    def test_values_stay_in_range(self):
+    def test_values_stay_in_range(self, trajectories):
         """All projected values should be 0-100."""
-        result = project_career_trajectory(
-            player_id=7,
-            current_age=24,
-            current_value=95,
-            improvement_score=80,
+        points = trajectories[7].trajectory
+        projected = np.array([p.projected_value for p in points])
+        upper = np.array([p.upper_bound for p in points])
+        lower = np.array([p.lower_bound for p in points])
+
+        bad = check_trajectory_bounds(projected, upper, lower)
+        assert bad == -1, (
+            f"point {bad} out of bounds: projected={projected[bad]}, "
+            f"lower={lower[bad]}, upper={upper[bad]}"
         )
-        for p in result.trajectory:
-            assert 0 <= p.projected_value <= 100
-            assert 0 <= p.upper_bound <= 100
-            assert 0 <= p.lower_bound <= 100
-            assert p.lower_bound <= p.projected_value <= p.upper_bound
 
 
 class TestPitcherTrajectory:
     """Test pitcher-specific trajectory behavior."""
 
-    def test_pitcher_peaks_earlier(self):
+    def test_pitcher_peaks_earlier(self, trajectories):
         """Pitchers peak at 26, one year earlier than batters."""
-        batter = project_career_trajectory(
-            player_id=10, current_age=25, current_value=70,
-            player_type="batter",
-        )
-        pitcher = project_career_trajectory(
-            player_id=11, current_age=25, current_value=70,
-            player_type="pitcher",
-        )
+        batter, pitcher = trajectories[10], trajectories[11]
         # At age 25, pitcher is closer to peak than batter
         # So pitcher's year-1 projection should be higher (aging curve boost)
         assert pitcher.trajectory[0].projected_value >= batter.trajectory[0].projected_value - 5
 
 
+class TestReplacementLevel:
+    """current_value <= 0 skips the aging-curve math."""
+
+    @pytest.mark.parametrize("age", [23, 27, 31, 36])
+    @pytest.mark.parametrize("current_value", [0.0, -5.0])
+    def test_zero_value_matches_full_computation(self, monkeypatch, age, current_value):
+        """The shortcut should give all zeros and the grade the full projection would."""
+        arrays = _project_value_matrix(
+            current_ages=np.array([age]),
+            current_values=np.array([current_value], dtype=np.float32),
+            is_pitcher=np.array([False]),
+            improvement_scores=np.array([0.0], dtype=np.float32),
+            consistency_scores=np.array([50.0], dtype=np.float32),
+            projection_years=6,
+        )
+        full = trajectory_model._build_trajectory(
+            player_id=1, current_age=age, current_value=current_value, peak_age=27,
+            improvement_score=0.0, projected=arrays[0][0], upper=arrays[1][0],
+            lower=arrays[2][0], current_season=2025,
+        )
+        calls = []
+        monkeypatch.setattr(
+            trajectory_model, "_project_value_matrix",
+            lambda **kwargs: calls.append(kwargs) or _project_value_matrix(**kwargs),
+        )
+
+        result = project_career_trajectory(1, age, current_value)
+
+        assert not calls
+        assert all(
+            (p.projected_value, p.upper_bound, p.lower_bound) == (0, 0, 0)
+            for p in result.trajectory
+        )
+        assert result.trajectory_grade == full.trajectory_grade
+        assert result == full
+
+    def test_small_positive_value_runs_full_projection(self, monkeypatch):
+        """A value just above zero should still go through the aging-curve math."""
+        calls = []
+        monkeypatch.setattr(
+            trajectory_model, "_project_value_matrix",
+            lambda **kwargs: calls.append(kwargs) or _project_value_matrix(**kwargs),
+        )
+
+        result = project_career_trajectory(1, 24, 0.3)
+
+        assert len(calls) == 1
+        assert result.trajectory[0].projected_value > 0
+
+
 class TestBatchProjection:
     """Test batch projection utility."""
 
@@ -148,27 +183,73 @@ class TestBatchProjection:
         assert len(results) == 1
         assert results[0].player_id == 1
 
+    def test_single_matches_batch(self, trajectories):
+        """project_career_trajectory should agree with the batch projection."""
+        single = project_career_trajectory(
+            player_id=1, current_age=23, current_value=55, player_type="batter",
+            improvement_score=60, consistency_score=70, dynasty_value=80,
+        )
+        assert single == trajectories[1]
+
+    @pytest.mark.parametrize("parallel", [False, True], ids=["numpy", "numba"])
+    def test_fractional_ages_match_single(self, monkeypatch, parallel):
+        """Batch projection should keep fractional ages, agreeing with the single path."""
+        if parallel:
+            pytest.importorskip("numba")
+        monkeypatch.setattr(trajectory_model, "_PARALLEL_MIN_PLAYERS", 0 if parallel else 10**9)
+        players = [
+            {"player_id": 1, "age": 27.9, "current_value": 50},
+            {"player_id": 2, "age": 23.4, "current_value": 65, "player_type": "pitcher",
+             "improvement_score": 40, "consistency_score": 75},
+            {"player_id": 3, "age": 33.5, "current_value": 45, "improvement_score": -25},
+        ]
+        singles = [
+            project_career_trajectory(
+                p["player_id"], p["age"], p["current_value"], p.get("player_type", "batter"),
+                p.get("improvement_score", 0), p.get("consistency_score", 50),
+            )
+            for p in players
+        ]
+
+        assert batch_project_trajectories(players) == singles
+        assert singles[0].trajectory[0].age == 28.9
+
+    def test_invalid_player_id_skips_only_that_player(self):
+        """A missing or non-numeric player_id should drop that player, not the batch."""
+        players = [{"player_id": "abc"}, {"player_id": None}, {"player_id": 2}]
+
+        assert [t.player_id for t in batch_project_trajectories(players)] == [2]
+
+    @pytest.mark.parametrize("fractional", [False, True], ids=["whole", "fractional"])
+    def test_parallel_kernel_matches_numpy(self, fractional):
+        """The numba kernel should reproduce the NumPy projection exactly."""
+        pytest.importorskip("numba")
+        from backend.ml.models.trajectory_model import _project_value_matrix_parallel
+
+        rng = np.random.default_rng(0)
+        n = 500
+        args = (
+            rng.uniform(18, 43, n) if fractional else rng.integers(18, 43, n),
+            rng.uniform(0, 100, n).astype(np.float32),
+            rng.random(n) < 0.4,
+            rng.uniform(-100, 100, n).astype(np.float32),
+            rng.uniform(0, 100, n).astype(np.float32),
+            10,
+        )
+        for expected, actual in zip(
+            _project_value_matrix(*args), _project_value_matrix_parallel(*args)
+        ):
+            np.testing.assert_array_equal(actual, expected)
+
 
 class TestTrajectoryGrades:
     """Test trajectory grading logic."""
 
-    def test_rising_grade(self):
-        result = project_career_trajectory(
-            player_id=20, current_age=22, current_value=40,
-            improvement_score=50,
-        )
-        assert result.trajectory_grade == "Rising"
+    def test_rising_grade(self, trajectories):
+        assert trajectories[20].trajectory_grade == "Rising"
 
-    def test_peak_grade(self):
-        result = project_career_trajectory(
-            player_id=21, current_age=27, current_value=80,
-            improvement_score=15,
-        )
-        assert result.trajectory_grade == "Peak"
+    def test_peak_grade(self, trajectories):
+        assert trajectories[21].trajectory_grade == "Peak"
 
-    def test_late_career_grade(self):
-        result = project_career_trajectory(
-            player_id=22, current_age=36, current_value=40,
-            improvement_score=-20,
-        )
-        assert result.trajectory_grade in ("Declining", "Late Career")
+    def test_late_career_grade(self, trajectories):
+        assert trajectories[22].trajectory_grade in ("Declining", "Late Career")
@@ -1,5 +1,6 @@
 """Tests for the composite AI Value Score model."""
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -7,93 +8,95 @@ from backend.ml.models.value_model import calculate_ai_value_scores
 
 
 class TestAIValueScore:
-    def _make_scores_df(self, players: list[dict]) -> pd.DataFrame:
-        return pd.DataFrame(players)
-
-    def test_high_value_player_scores_high(self):
+    def test_high_value_player_scores_high(self, high_value_df_and_ages):
         """A player with strong scores across the board should rank high."""
-        df = self._make_scores_df([{
-            "player_id": 1,
-            "sleeper_score": 80.0,
-            "bust_score": 10.0,
-            "regression_direction": 0.02,
-            "consistency_score": 85.0,
-            "improvement_score": 50.0,
-            "auction_value": 35.0,
-            "dynasty_value": 90.0,
-            "surplus_value": 10.0,
-        }])
-        ages = {1: 25}
+        df, ages = high_value_df_and_ages
         result = calculate_ai_value_scores(df, ages)
 
-        score = result.iloc[0]["ai_value_score"]
+        score = result["ai_value_score"].to_numpy()[0]
         assert score > 70, f"High-value player should score >70, got {score}"
 
-    def test_bust_risk_player_scores_lower(self):
+    def test_bust_risk_player_scores_lower(self, bust_risk_df_and_ages):
         """A player with high bust risk should score lower."""
-        df = self._make_scores_df([{
-            "player_id": 2,
-            "sleeper_score": 20.0,
-            "bust_score": 85.0,
-            "regression_direction": -0.03,
-            "consistency_score": 30.0,
-            "improvement_score": -40.0,
-            "auction_value": 25.0,
-            "dynasty_value": 20.0,
-            "surplus_value": -5.0,
-        }])
-        ages = {2: 34}
+        df, ages = bust_risk_df_and_ages
         result = calculate_ai_value_scores(df, ages)
 
-        score = result.iloc[0]["ai_value_score"]
+        score = result["ai_value_score"].to_numpy()[0]
         assert score < 50, f"Bust-risk player should score <50, got {score}"
 
-    def test_score_in_valid_range(self):
+    def test_score_in_valid_range(self, extreme_scores_df_and_ages):
         """All scores should be between 0 and 100."""
-        df = self._make_scores_df([
-            {"player_id": 1, "sleeper_score": 100, "bust_score": 0,
-             "consistency_score": 100, "improvement_score": 100,
-             "auction_value": 50, "dynasty_value": 100},
-            {"player_id": 2, "sleeper_score": 0, "bust_score": 100,
-             "consistency_score": 0, "improvement_score": -100,
-             "auction_value": 1, "dynasty_value": 0},
-        ])
-        ages = {1: 24, 2: 38}
+        df, ages = extreme_scores_df_and_ages
         result = calculate_ai_value_scores(df, ages)
 
-        for _, row in result.iterrows():
-            assert 0 <= row["ai_value_score"] <= 100
+        scores = result["ai_value_score"].to_numpy()
+        assert ((scores >= 0) & (scores <= 100)).all()
 
     def test_young_player_bonus(self):
         """A young pre-peak player should get an age curve bonus."""
-        young = self._make_scores_df([{
-            "player_id": 1, "sleeper_score": 50, "bust_score": 50,
-            "consistency_score": 50, "improvement_score": 0,
-            "auction_value": 20, "dynasty_value": 50,
-        }])
-        old = self._make_scores_df([{
-            "player_id": 2, "sleeper_score": 50, "bust_score": 50,
+        profile = {
+            "sleeper_score": 50, "bust_score": 50,
             "consistency_score": 50, "improvement_score": 0,
             "auction_value": 20, "dynasty_value": 50,
-        }])
+        }
+        young = pd.DataFrame([{"player_id": 1, **profile}])
+        old = pd.DataFrame([{"player_id": 2, **profile}])
 
         young_result = calculate_ai_value_scores(young, {1: 24})
         old_result = calculate_ai_value_scores(old, {2: 36})
 
-        assert young_result.iloc[0]["ai_value_score"] > old_result.iloc[0]["ai_value_score"]
+        young_score = young_result["ai_value_score"].to_numpy()[0]
+        old_score = old_result["ai_value_score"].to_numpy()[0]
+        assert young_score > old_score
 
-    def test_value_components_included(self):
+    def test_value_components_included(self, peak_age_df_and_ages):
         """Result should include component breakdown dict."""
-        df = self._make_scores_df([{
-            "player_id": 1, "sleeper_score": 60, "bust_score": 30,
-            "consistency_score": 70, "improvement_score": 20,
-            "auction_value": 25, "dynasty_value": 60,
-        }])
-        result = calculate_ai_value_scores(df, {1: 27})
+        df, ages = peak_age_df_and_ages
+        result = calculate_ai_value_scores(df, ages)
 
         assert "value_components" in result.columns
-        components = result.iloc[0]["value_components"]
+        components = result["value_components"].to_numpy()[0]
         assert "projected_value" in components
         assert "sleeper_upside" in components
         assert "bust_safety" in components
         assert "dynasty_premium" in components
+
+    def test_components_can_be_skipped(self, peak_age_df_and_ages):
+        """include_components=False should return only the score columns."""
+        df, ages = peak_age_df_and_ages
+        full = calculate_ai_value_scores(df, ages)
+        lean = calculate_ai_value_scores(df, ages, include_components=False)
+
+        assert list(lean.columns) == ["player_id", "ai_value_score"]
+        assert lean["ai_value_score"].to_numpy()[0] == full["ai_value_score"].to_numpy()[0]
+
+    def test_trajectory_outlook_can_be_disabled(self, peak_age_df_and_ages):
+        """Disabling trajectory_outlook should drop that component entirely."""
+        df, ages = peak_age_df_and_ages
+        result = calculate_ai_value_scores(df, ages, trajectory_outlook=False)
+
+        components = result["value_components"].to_numpy()[0]
+        assert "trajectory_outlook" not in components
+        assert 0 <= result["ai_value_score"].to_numpy()[0] <= 100
+
+    @pytest.mark.parametrize("column", [
+        "sleeper_score", "bust_score", "consistency_score",
+        "improvement_score", "auction_value", "dynasty_value",
+    ])
+    def test_nan_score_uses_default(self, column):
+        """A NaN input score should count as missing rather than turn the result NaN."""
+        profile = {
+            "player_id": 1, "sleeper_score": 60, "bust_score": 30,
+            "consistency_score": 70, "improvement_score": 20,
+            "auction_value": 25, "dynasty_value": 65,
+        }
+        with_nan = pd.DataFrame([{**profile, column: np.nan}])
+        without = pd.DataFrame([profile]).drop(columns=column)
+
+        nan_result = calculate_ai_value_scores(with_nan, {1: 27})
+        missing_result = calculate_ai_value_scores(without, {1: 27})
+
+        score = nan_result["ai_value_score"].to_numpy()[0]
+        assert not np.isnan(score)
+        assert score == missing_result["ai_value_score"].to_numpy()[0]
+        assert nan_result["value_components"][0] == missing_result["value_components"][0]
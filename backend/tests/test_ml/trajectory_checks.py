@@ -0,0 +1,20 @@
+"""Compiled invariant checks for projected trajectories.
+
+numba is optional; without it the checks run as plain Python.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def check_trajectory_bounds(projected, upper, lower) -> int:
+    """Index of the first point outside 0 <= lower <= projected <= upper <= 100, or -1."""
+    for i in range(projected.shape[0]):
+        if not (0 <= lower[i] <= projected[i] <= upper[i] <= 100):
+            return i
+    return -1
+
+if njit is not None:
+    check_trajectory_bounds = njit(cache=True)(check_trajectory_bounds)
@@ -12,31 +12,27 @@ from backend.data_pipeline.transformers.cleaning import (
 
 
 class TestParsePercentage:
-    def test_string_percentage(self):
-        """Should parse '25.0%' -> 0.25."""
-        series = pd.Series(["25.0%", "10.5%", "0.0%"])
-        result = _parse_pct_column(series)
-        assert abs(result.iloc[0] - 0.25) < 0.001
-        assert abs(result.iloc[1] - 0.105) < 0.001
-
-    def test_float_in_0_to_1_range(self):
-        """Should pass through floats already in 0-1 range."""
-        series = pd.Series([0.25, 0.105, 0.0])
-        result = _parse_pct_column(series)
-        assert abs(result.iloc[0] - 0.25) < 0.001
-
-    def test_float_in_0_to_100_range(self):
-        """Should convert floats in 0-100 range to 0-1."""
-        series = pd.Series([25.0, 10.5, 0.0])
-        result = _parse_pct_column(series)
-        assert abs(result.iloc[0] - 0.25) < 0.001
-
-    def test_handles_nan(self):
-        """Should handle NaN values."""
-        series = pd.Series(["25.0%", "", None])
-        result = _parse_pct_column(series)
-        assert not np.isnan(result.iloc[0])
-        assert np.isnan(result.iloc[1])
+    @pytest.mark.parametrize(
+        ("values", "expected"),
+        [
+            # '25.0%' strings -> fractions
+            (["25.0%", "10.5%", "0.0%"], [0.25, 0.105, 0.0]),
+            # Floats already in 0-1 range pass through
+            ([0.25, 0.105, 0.0], [0.25, 0.105, 0.0]),
+            # Floats in 0-100 range are scaled to 0-1
+            ([25.0, 10.5, 0.0], [0.25, 0.105, 0.0]),
+            # Blank and missing strings become NaN
+            (["25.0%", "", None], [0.25, np.nan, np.nan]),
+        ],
+        ids=["string_percentage", "float_0_to_1", "float_0_to_100", "handles_nan"],
+    )
+    def test_parse(self, values, expected):
+        """Should normalize each input format to a 0-1 fraction."""
+        result = _parse_pct_column(pd.Series(values))
+        pd.testing.assert_series_equal(
+            result, pd.Series(expected, dtype="float64"),
+            check_exact=False, rtol=0, atol=1e-3, check_names=False,
+        )
 
 
 class TestCleanBattingStats:
@@ -0,0 +1,151 @@
+"""Tests for the pure helpers in the inference script."""
+
+import json
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from scripts import run_inference
+from scripts.run_inference import (
+    _PROJECTION_COLUMNS,
+    _PROJECTION_FLOAT_COLUMNS,
+    _build_marcel_map,
+    _copy_record,
+    _estimate_ages,
+    _float_rows,
+    _jsonb_text,
+    _projection_values,
+)
+
+_JSONB_PAYLOAD = {
+    "k_pct": {"value": np.float32(0.25), "trend": np.nan, "seasons": np.int64(3)},
+    "flags": [True, np.bool_(False), None, float("inf")],
+    "shap": np.array([0.5, -0.25]),
+    7: "non-string key",
+}
+
+
+class _FixedDate(date):
+    @classmethod
+    def today(cls):
+        return cls(2025, 6, 15)
+
+
+class TestFloatRows:
+    def test_rounds_and_nulls_missing_values(self):
+        """Values round to 4 places; NaN, None, strings and Infinity become None."""
+        scores = pd.DataFrame({
+            "sleeper_score": [61.234567, np.nan, np.inf],
+            "bust_score": pd.Series([None, "12.5", "n/a"], dtype=object),
+            "improvement_score": [40, 50, 60],
+        })
+        rows = _float_rows(scores)
+
+        assert [row[0] for row in rows] == [61.2346, None, None]
+        assert [row[1] for row in rows] == [None, 12.5, None]
+        assert [row[5] for row in rows] == [40.0, 50.0, 60.0]
+
+    def test_missing_columns_are_none(self):
+        """Columns the scores frame lacks come out as None in every row."""
+        rows = _float_rows(pd.DataFrame({"sleeper_score": [1.0]}))
+
+        assert len(rows[0]) == len(_PROJECTION_FLOAT_COLUMNS)
+        assert rows[0][1:] == [None] * (len(_PROJECTION_FLOAT_COLUMNS) - 1)
+
+
+class TestJsonbText:
+    def test_orjson_matches_json_fallback(self, monkeypatch):
+        """orjson and the json.dumps fallback should store the same JSONB document."""
+        pytest.importorskip("orjson")
+        with_orjson = _jsonb_text(_JSONB_PAYLOAD)
+        monkeypatch.setattr(run_inference, "orjson", None)
+
+        assert json.loads(_jsonb_text(_JSONB_PAYLOAD)) == json.loads(with_orjson)
+
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "json"])
+    def test_non_finite_and_numpy_values(self, monkeypatch, use_orjson):
+        """NaN/Infinity serialize as null and numpy values as plain JSON."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(run_inference, "orjson", None)
+
+        assert json.loads(_jsonb_text(_JSONB_PAYLOAD)) == {
+            "k_pct": {"value": 0.25, "trend": None, "seasons": 3},
+            "flags": [True, False, None, None],
+            "shap": [0.5, -0.25],
+            "7": "non-string key",
+        }
+
+
+class TestCopyRecord:
+    def test_orders_columns_and_writes_json_null(self):
+        """COPY records follow _PROJECTION_COLUMNS; None JSONB is JSON null, not SQL NULL."""
+        scores = pd.DataFrame({
+            "player_id": [42],
+            "sleeper_score": [55.5],
+            "shap_explanations": [None],
+            "value_components": [{"sgp": 1.5}],
+        })
+        row = next(scores.itertuples(index=False))
+        values = _projection_values(row, _float_rows(scores)[0], {42: {"hr": 30}})
+        record = dict(zip(_PROJECTION_COLUMNS, _copy_record(values)))
+
+        assert record["player_id"] == 42
+        assert record["model_version"] == run_inference.MODEL_VERSION
+        assert record["sleeper_score"] == 55.5
+        assert record["bust_score"] is None
+        assert json.loads(record["shap_explanations"]) == {"value_components": {"sgp": 1.5}}
+        assert record["stat_consistency_breakdown"] == "null"
+        assert json.loads(record["marcel_projections"]) == {"hr": 30}
+
+
+class TestEstimateAges:
+    @pytest.fixture(autouse=True)
+    def fixed_today(self, monkeypatch):
+        monkeypatch.setattr(run_inference, "date", _FixedDate)
+
+    def test_birth_dates_and_career_fallback(self):
+        """Birth dates decide age when valid; otherwise the first tracked season does."""
+        players = pd.DataFrame({
+            "player_id": [1, 2, 3, 4, 5],
+            "birth_date": [date(1995, 6, 15), "1995-06-16", "1995-13-40", None, date(2000, 1, 1)],
+        })
+        batting = pd.DataFrame({"player_id": [3, 3, 4], "season": [2020, 2022, 2023]})
+        pitching = pd.DataFrame({"player_id": [4, 6], "season": [2021, 2024]})
+
+        ages = _estimate_ages(batting, pitching, players)
+
+        assert ages == {
+            1: 30,  # birthday is today
+            2: 29,  # birthday is tomorrow
+            3: 29,  # invalid date: 24 in 2020
+            4: 28,  # earliest season across batting and pitching: 2021
+            5: 25,
+            6: 25,
+        }
+
+    def test_no_season_data(self):
+        """Without season data only birth-date ages are returned."""
+        players = pd.DataFrame({"player_id": [1, 2], "birth_date": ["1990-01-01", None]})
+        empty = pd.DataFrame(columns=["player_id", "season"])
+
+        assert _estimate_ages(empty, empty, players) == {1: 35}
+
+
+class TestBuildMarcelMap:
+    def test_drops_nan_and_later_frames_win(self):
+        """NaN stats are left out, and a player in both frames takes the later one."""
+        batters = pd.DataFrame({"player_id": [1, 2], "hr": [30, 12], "avg": [0.280, np.nan]})
+        pitchers = pd.DataFrame({"player_id": [2, 3], "era": [3.10, np.nan], "so": [180, 95]})
+
+        marcel_map = _build_marcel_map(batters, pd.DataFrame(), pitchers)
+
+        assert marcel_map == {
+            1: {"hr": 30, "avg": 0.280},
+            2: {"era": 3.10, "so": 180},
+            3: {"so": 95},
+        }
+        assert type(marcel_map[1]["hr"]) is int
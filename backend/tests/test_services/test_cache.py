@@ -1,27 +1,29 @@
 """Tests for the API cache service."""
 
 import asyncio
+from types import SimpleNamespace
+
 import pytest
 
+from backend.app.services import cache_service
 from backend.app.services.cache_service import (
     cached,
     invalidate_all,
     invalidate_prefix,
     cache_stats,
-    _cache,
 )
 
 
 @pytest.fixture(autouse=True)
-def clear_cache():
-    """Clear cache before each test."""
-    _cache.clear()
-    yield
-    _cache.clear()
+def clear_cache(monkeypatch):
+    """Give each test a fresh, empty cache; the original is restored afterwards."""
+    monkeypatch.setattr(cache_service, "_cache", {})
 
 
+# The async tests are microsecond-scale, so they share one module-scoped event
+# loop rather than paying for a new loop per test
 class TestCacheDecorator:
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_cache_hit(self):
         """Second call should return cached result without re-executing."""
         call_count = 0
@@ -39,7 +41,7 @@ class TestCacheDecorator:
         assert result2 == 10
         assert call_count == 1  # Only called once
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_different_args_different_cache(self):
         """Different arguments should produce different cache entries."""
         @cached(ttl=60)
@@ -52,25 +54,48 @@ class TestCacheDecorator:
         assert r1 == 10
         assert r2 == 20
 
-    @pytest.mark.asyncio
-    async def test_cache_expiry(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_primed_entry_short_circuits(self):
+        """A live entry under the call's key should be returned without running the function."""
+        call_count = 0
+
+        @cached(ttl=60)
+        async def func(x: int) -> int:
+            nonlocal call_count
+            call_count += 1
+            return x * 2
+
+        # Keys are the function name followed by its stringified arguments
+        cache_service._cache["func:5"] = (99, float("inf"))
+
+        assert await func(5) == 99
+        assert call_count == 0
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_cache_expiry(self, monkeypatch):
         """Expired entries should trigger re-execution."""
         call_count = 0
+        now = 1000.0
+        monkeypatch.setattr(cache_service, "time", SimpleNamespace(time=lambda: now))
 
-        @cached(ttl=0)  # Immediate expiry
+        @cached(ttl=60)
         async def func() -> str:
             nonlocal call_count
             call_count += 1
             return "result"
 
         await func()
-        await func()  # Should re-execute since TTL=0
+        now += 30
+        await func()  # Still fresh
+        assert call_count == 1
 
+        now += 31
+        await func()  # Past the TTL, so it should re-execute
         assert call_count == 2
 
 
 class TestCacheManagement:
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_invalidate_all(self):
         """invalidate_all should clear all entries."""
         @cached(ttl=60)
@@ -79,28 +104,28 @@ class TestCacheManagement:
 
         await func(1)
         await func(2)
-        assert cache_stats()["total_entries"] == 2
+        assert len(cache_service._cache) == 2
 
         count = invalidate_all()
         assert count == 2
-        assert cache_stats()["total_entries"] == 0
+        assert len(cache_service._cache) == 0
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_invalidate_prefix(self):
         """invalidate_prefix should clear matching entries only."""
-        _cache["rankings:all"] = ("data", float("inf"))
-        _cache["rankings:sleepers"] = ("data", float("inf"))
-        _cache["players:detail"] = ("data", float("inf"))
+        cache_service._cache["rankings:all"] = ("data", float("inf"))
+        cache_service._cache["rankings:sleepers"] = ("data", float("inf"))
+        cache_service._cache["players:detail"] = ("data", float("inf"))
 
         count = invalidate_prefix("rankings")
         assert count == 2
-        assert len(_cache) == 1
+        assert len(cache_service._cache) == 1
 
     def test_cache_stats(self):
         """cache_stats should report correct counts."""
         import time
-        _cache["active"] = ("data", time.time() + 3600)
-        _cache["expired"] = ("data", time.time() - 100)
+        cache_service._cache["active"] = ("data", time.time() + 3600)
+        cache_service._cache["expired"] = ("data", time.time() - 100)
 
         stats = cache_stats()
         assert stats["total_entries"] == 2
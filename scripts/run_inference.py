@@ -14,13 +14,15 @@ This script:
 """
 
 import asyncio
+import json
 import logging
 import math
-from datetime import date, datetime
+from datetime import date
 
+import numpy as np
 import pandas as pd
-from sqlalchemy import select
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import Float, Text, bindparam, cast, select
+from sqlalchemy.dialects.postgresql import JSONB, insert
 
 from backend.app.config import settings
 from backend.app.db.base import Base
@@ -43,6 +45,11 @@ from backend.data_pipeline.transformers.feature_engineering import (
 from backend.ml.inference.predictor import Predictor
 from backend.ml.models.marcel_baseline import project_all_batters, project_all_pitchers
 
+try:  # orjson serializes JSONB payloads (numpy values included) in one C pass
+    import orjson
+except ImportError:
+    orjson = None
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s %(levelname)s %(name)s: %(message)s",
@@ -50,6 +57,9 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 MODEL_VERSION = "v1.0-initial"
+INSERT_BATCH_SIZE = 1000  # Rows per executemany when COPY isn't available
+STREAM_PARTITION_SIZE = 10_000  # Rows fetched per round-trip when loading season data
+THREADED_MIN_ROWS = 2000  # Season rows below which worker-thread handoff costs more than it saves
 
 
 async def main():
@@ -78,27 +88,44 @@ async def main():
 
     # Step 3: Marcel baseline projections
     logger.info("Step 3: Generating Marcel baseline projections...")
-    batter_marcel = project_all_batters(batting_df, player_ages)
-    pitcher_marcel = project_all_pitchers(pitching_df, player_ages)
-    logger.info(
-        f"Marcel projections: {len(batter_marcel)} batters, {len(pitcher_marcel)} pitchers"
-    )
+    season_rows = len(batting_df) + len(pitching_df)
+    # Feature engineering only needs the season data, so start it now and let
+    # it overlap the Marcel and auction steps
+    features_task = asyncio.ensure_future(_run_pair(
+        season_rows,
+        (engineer_batting_features, batting_df, player_ages),
+        (engineer_pitching_features, pitching_df, player_ages),
+    ))
+    try:
+        batter_marcel, pitcher_marcel = await _run_pair(
+            season_rows,
+            (project_all_batters, batting_df, player_ages),
+            (project_all_pitchers, pitching_df, player_ages),
+        )
+        logger.info(
+            f"Marcel projections: {len(batter_marcel)} batters, {len(pitcher_marcel)} pitchers"
+        )
 
-    # Step 4: Auction & dynasty values
-    logger.info("Step 4: Calculating auction and dynasty values...")
-    batter_values, pitcher_values = calculate_sgp_values(batter_marcel, pitcher_marcel)
-    batter_values = calculate_surplus_value(batter_values)
-    pitcher_values = calculate_surplus_value(pitcher_values)
-    batter_values = calculate_dynasty_value(batter_values, player_ages)
-    pitcher_values = calculate_dynasty_value(pitcher_values, player_ages)
-    logger.info(
-        f"Auction values: {len(batter_values)} batters, {len(pitcher_values)} pitchers"
-    )
+        # Step 4: Auction & dynasty values
+        logger.info("Step 4: Calculating auction and dynasty values...")
+        batter_values, pitcher_values = calculate_sgp_values(batter_marcel, pitcher_marcel)
+        batter_values, pitcher_values = await _run_pair(
+            season_rows,
+            (_surplus_and_dynasty, batter_values, player_ages),
+            (_surplus_and_dynasty, pitcher_values, player_ages),
+        )
+        logger.info(
+            f"Auction values: {len(batter_values)} batters, {len(pitcher_values)} pitchers"
+        )
+    except BaseException:
+        # Don't leave the feature task running unobserved if an earlier step fails
+        features_task.cancel()
+        await asyncio.gather(features_task, return_exceptions=True)
+        raise
 
     # Step 5: Feature engineering
     logger.info("Step 5: Engineering features...")
-    batter_features = engineer_batting_features(batting_df, player_ages)
-    pitcher_features = engineer_pitching_features(pitching_df, player_ages)
+    batter_features, pitcher_features = await features_task
     logger.info(
         f"Features: {len(batter_features)} batters ({len(batter_features.columns)} cols), "
         f"{len(pitcher_features)} pitchers ({len(pitcher_features.columns)} cols)"
@@ -131,21 +158,7 @@ async def main():
 
     # Step 7: Build Marcel projections dict for storage
     logger.info("Step 7: Preparing Marcel projections for storage...")
-    marcel_map = {}
-    if not batter_marcel.empty:
-        for _, row in batter_marcel.iterrows():
-            pid = row["player_id"]
-            marcel_map[pid] = {
-                k: v for k, v in row.to_dict().items()
-                if k != "player_id" and pd.notna(v)
-            }
-    if not pitcher_marcel.empty:
-        for _, row in pitcher_marcel.iterrows():
-            pid = row["player_id"]
-            marcel_map[pid] = {
-                k: v for k, v in row.to_dict().items()
-                if k != "player_id" and pd.notna(v)
-            }
+    marcel_map = _build_marcel_map(batter_marcel, pitcher_marcel)
 
     # Step 8: Save projections to database
     logger.info("Step 8: Saving projections to database...")
@@ -167,31 +180,61 @@ async def main():
             )
 
 
+async def _run_pair(rows: int, first: tuple, second: tuple) -> tuple:
+    """Run two independent (func, *args) calls and return both results.
+
+    The batter and pitcher halves of each step touch disjoint frames, so on
+    league-sized inputs they go to worker threads and overlap wherever pandas
+    and NumPy drop the GIL. Small inputs just run inline.
+    """
+    if rows < THREADED_MIN_ROWS:
+        return first[0](*first[1:]), second[0](*second[1:])
+    return tuple(await asyncio.gather(asyncio.to_thread(*first), asyncio.to_thread(*second)))
+
+
+def _surplus_and_dynasty(values: pd.DataFrame, player_ages: dict[int, int]) -> pd.DataFrame:
+    """Add surplus and dynasty value columns to one side's auction values."""
+    return calculate_dynasty_value(calculate_surplus_value(values), player_ages)
+
+
 async def _load_season_data() -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """Load all season data and players from the database."""
-    async with async_session_factory() as session:
-        # Load players
-        result = await session.execute(
-            select(Player.id, Player.full_name, Player.birth_date, Player.position, Player.team)
-        )
-        players_rows = result.all()
-        players_df = pd.DataFrame(
-            players_rows, columns=["player_id", "full_name", "birth_date", "position", "team"]
-        )
+    players_query = select(
+        Player.id.label("player_id"),
+        Player.full_name,
+        Player.birth_date,
+        Player.position,
+        Player.team,
+    )
+    async with engine.connect() as conn:
+        players_df = await _stream_frame(conn, players_query)
+        batting_df = await _stream_frame(conn, select(BattingSeason.__table__))
+        pitching_df = await _stream_frame(conn, select(PitchingSeason.__table__))
 
-        # Load batting seasons
-        bat_cols = [c for c in BattingSeason.__table__.columns]
-        result = await session.execute(select(*bat_cols))
-        bat_rows = result.all()
-        batting_df = pd.DataFrame(bat_rows, columns=[c.name for c in bat_cols])
+    return batting_df, pitching_df, players_df
 
-        # Load pitching seasons
-        pit_cols = [c for c in PitchingSeason.__table__.columns]
-        result = await session.execute(select(*pit_cols))
-        pit_rows = result.all()
-        pitching_df = pd.DataFrame(pit_rows, columns=[c.name for c in pit_cols])
 
-    return batting_df, pitching_df, players_df
+async def _stream_frame(conn, query) -> pd.DataFrame:
+    """Stream a query's rows straight into per-column lists and build a DataFrame.
+
+    Rows arrive in partitions from a server-side cursor and are transposed into
+    their columns as they come, so the full result never sits in memory as a
+    list of row tuples. Float columns are built as float64 with NULL as NaN.
+    """
+    columns = list(query.selected_columns)
+    values: list[list] = [[] for _ in columns]
+    result = await conn.stream(query)
+    async for partition in result.partitions(STREAM_PARTITION_SIZE):
+        for column_values, partition_values in zip(values, zip(*partition)):
+            column_values.extend(partition_values)
+
+    return pd.DataFrame({
+        col.name: (
+            np.asarray(col_values, dtype=np.float64)
+            if isinstance(col.type, Float) else col_values
+        )
+        for col, col_values in zip(columns, values)
+    })
 
 
 def _estimate_ages(
@@ -204,119 +247,190 @@ def _estimate_ages(
     Uses birth_date if available, otherwise estimates from career data.
     """
     today = date.today()
-    ages: dict[int, int] = {}
 
     # First, use birth_date from player records if available
-    for _, row in players_df.iterrows():
-        pid = row["player_id"]
-        bd = row.get("birth_date")
-        if pd.notna(bd) and bd is not None:
-            try:
-                if isinstance(bd, str):
-                    bd = datetime.strptime(bd, "%Y-%m-%d").date()
-                age = today.year - bd.year - (
-                    (today.month, today.day) < (bd.month, bd.day)
-                )
-                ages[pid] = age
-            except (ValueError, TypeError):
-                pass
+    birth_dates = pd.to_datetime(players_df["birth_date"], format="%Y-%m-%d", errors="coerce")
+    known = birth_dates.notna()
+    bd = birth_dates[known].dt
+    # Pack month/day as MMDD so "birthday not reached yet" is a single int compare
+    before_birthday = bd.month * 100 + bd.day > today.month * 100 + today.day
+    birth_date_ages = today.year - bd.year - before_birthday.astype(int)
+    known_ids = players_df.loc[known, "player_id"].to_numpy()
+    ages: dict[int, int] = dict(zip(known_ids.tolist(), birth_date_ages.astype(int).tolist()))
 
     # For players without birth_date, estimate from career data
     # Assumption: average MLB debut age is ~24, so approximate age from
     # first season in our data
-    all_player_ids = set()
-    if not batting_df.empty:
-        all_player_ids.update(batting_df["player_id"].unique())
-    if not pitching_df.empty:
-        all_player_ids.update(pitching_df["player_id"].unique())
-
-    for pid in all_player_ids:
-        if pid in ages:
-            continue
-
-        # Find earliest season for this player
-        earliest_season = None
-        if not batting_df.empty:
-            bat_seasons = batting_df.loc[batting_df["player_id"] == pid, "season"]
-            if len(bat_seasons) > 0:
-                earliest_season = bat_seasons.min()
-        if not pitching_df.empty:
-            pit_seasons = pitching_df.loc[pitching_df["player_id"] == pid, "season"]
-            if len(pit_seasons) > 0:
-                s = pit_seasons.min()
-                if earliest_season is None or s < earliest_season:
-                    earliest_season = s
-
-        if earliest_season is not None:
-            # Estimate: assume they were ~24 in their first tracked season
-            estimated_debut_age = 24
-            years_since_first = today.year - int(earliest_season)
-            ages[pid] = estimated_debut_age + years_since_first
-        else:
-            ages[pid] = 28  # Default fallback
+    first_seasons = [
+        df.groupby("player_id")["season"].min()
+        for df in (batting_df, pitching_df)
+        if not df.empty
+    ]
+    if not first_seasons:
+        return ages
+
+    earliest_season = pd.concat(first_seasons).groupby(level=0).min()
+    earliest_season = earliest_season[~earliest_season.index.isin(known_ids)]
+
+    # Estimate: assume they were ~24 in their first tracked season
+    estimated_debut_age = 24
+    estimated = (estimated_debut_age + today.year - earliest_season).fillna(28)  # Default fallback
+    ages.update(zip(earliest_season.index.tolist(), estimated.astype(int).tolist()))
 
     return ages
 
 
+def _build_marcel_map(*projections: pd.DataFrame) -> dict:
+    """Map player_id -> Marcel projected stats, leaving out stats that are NaN.
+
+    Later frames win when a player appears in more than one. NaN cells are
+    located with one isna pass over each frame, so only those entries are
+    touched in Python rather than every stat being checked.
+    """
+    marcel_map = {}
+    for df in projections:
+        if df.empty:
+            continue
+        stats = df.set_index("player_id")
+        records = stats.to_dict(orient="index")
+        pids = stats.index.tolist()
+        columns = stats.columns.tolist()
+        for i, j in zip(*np.nonzero(stats.isna().to_numpy())):
+            del records[pids[i]][columns[j]]
+        marcel_map.update(records)
+    return marcel_map
+
+
 async def _save_projections(scores: pd.DataFrame, marcel_map: dict) -> int:
-    """Save projection scores to the database."""
+    """Save projection scores to the database.
+
+    Rows are streamed in with a single COPY on asyncpg connections; other
+    drivers fall back to batched executemany INSERTs. Either way the whole
+    run lands in one transaction.
+    """
     if scores.empty:
         return 0
 
-    count = 0
-    async with async_session_factory() as session:
-        for _, row in scores.iterrows():
-            pid = int(row["player_id"])
-
-            # Build the projection values
-            values = {
-                "player_id": pid,
-                "model_version": MODEL_VERSION,
-                "sleeper_score": _safe_float(row.get("sleeper_score")),
-                "bust_score": _safe_float(row.get("bust_score")),
-                "regression_direction": _safe_float(row.get("regression_direction")),
-                "regression_magnitude": _safe_float(row.get("regression_magnitude")),
-                "consistency_score": _safe_float(row.get("consistency_score")),
-                "improvement_score": _safe_float(row.get("improvement_score")),
-                "ai_value_score": _safe_float(row.get("ai_value_score")),
-                "confidence": _safe_float(row.get("confidence")),
-                "auction_value": _safe_float(row.get("auction_value")),
-                "dynasty_value": _safe_float(row.get("dynasty_value")),
-                "surplus_value": _safe_float(row.get("surplus_value")),
-                "shap_explanations": _sanitize_jsonb(row.get("shap_explanations")),
-                "stat_consistency_breakdown": _sanitize_jsonb(row.get("stat_consistency_breakdown")),
-                "stat_improvement_breakdown": _sanitize_jsonb(row.get("stat_improvement_breakdown")),
-                "marcel_projections": _sanitize_jsonb(marcel_map.get(pid)),
-            }
-
-            # Handle value_components from AI value score
-            vc = row.get("value_components")
-            if isinstance(vc, dict):
-                values["shap_explanations"] = values.get("shap_explanations") or {}
-                if isinstance(values["shap_explanations"], dict):
-                    values["shap_explanations"]["value_components"] = _sanitize_jsonb(vc)
-
-            stmt = insert(Projection).values(**values)
-            await session.execute(stmt)
-            count += 1
-            if count % 500 == 0:
-                await session.flush()
-                logger.info(f"Saved {count} projections...")
+    rows = [
+        _projection_values(row, floats, marcel_map)
+        for row, floats in zip(scores.itertuples(index=False), _float_rows(scores))
+    ]
 
+    async with async_session_factory() as session:
+        conn = await session.connection()
+        if conn.dialect.driver == "asyncpg":
+            raw = await conn.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(
+                Projection.__tablename__,
+                records=[_copy_record(values) for values in rows],
+                columns=_PROJECTION_COLUMNS,
+            )
+        else:
+            for start in range(0, len(rows), INSERT_BATCH_SIZE):
+                batch = rows[start:start + INSERT_BATCH_SIZE]
+                await session.execute(_PROJECTION_INSERT, [_insert_values(v) for v in batch])
         await session.commit()
 
-    return count
+    return len(rows)
+
+
+# Columns written for each projection, in COPY order; id and run_date use server defaults
+_PROJECTION_FLOAT_COLUMNS = (
+    "sleeper_score",
+    "bust_score",
+    "regression_direction",
+    "regression_magnitude",
+    "consistency_score",
+    "improvement_score",
+    "ai_value_score",
+    "confidence",
+    "auction_value",
+    "dynasty_value",
+    "surplus_value",
+)
+_PROJECTION_JSONB_COLUMNS = (
+    "shap_explanations",
+    "stat_consistency_breakdown",
+    "stat_improvement_breakdown",
+    "marcel_projections",
+)
+_PROJECTION_COLUMNS = [
+    "player_id", "model_version", *_PROJECTION_FLOAT_COLUMNS, *_PROJECTION_JSONB_COLUMNS,
+]
+# Batched INSERT that takes JSONB columns as already-serialized JSON text, so
+# the driver's JSON encoder never walks the payloads a second time
+_PROJECTION_INSERT = insert(Projection).values({
+    col: cast(bindparam(col, type_=Text), JSONB) if col in _PROJECTION_JSONB_COLUMNS
+    else bindparam(col)
+    for col in _PROJECTION_COLUMNS
+})
+
+
+def _float_rows(scores: pd.DataFrame) -> list[list[float | None]]:
+    """Projection float columns of every row, rounded to 4 places.
+
+    Conversion and rounding run once per column rather than once per value.
+    Missing columns, non-numeric values and NaN/Infinity all come out as None.
+    """
+    numeric = scores.reindex(columns=list(_PROJECTION_FLOAT_COLUMNS))
+    values = numeric.apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float64).round(4)
+    cells = values.astype(object)
+    cells[~np.isfinite(values)] = None
+    return cells.tolist()
 
 
-def _safe_float(val) -> float | None:
-    """Convert a value to float safely, returning None for NaN/None."""
-    if val is None:
-        return None
-    try:
-        f = float(val)
-        return None if math.isnan(f) else round(f, 4)
-    except (ValueError, TypeError):
-        return None
+def _projection_values(row, floats: list[float | None], marcel_map: dict) -> dict:
+    """Build the projections-table values for one row of scores.
+
+    ``floats`` is the row's entry from _float_rows.
+    """
+    pid = int(row.player_id)
+    values = {"player_id": pid, "model_version": MODEL_VERSION}
+    values.update(zip(_PROJECTION_FLOAT_COLUMNS, floats))
+    # JSONB values stay raw here; each write path sanitizes or serializes them once
+    for col in _PROJECTION_JSONB_COLUMNS[:-1]:
+        values[col] = getattr(row, col, None)
+    values["marcel_projections"] = marcel_map.get(pid)
+
+    # Handle value_components from AI value score
+    vc = getattr(row, "value_components", None)
+    if isinstance(vc, dict):
+        shap = _sanitize_jsonb(values["shap_explanations"]) or {}
+        if isinstance(shap, dict):
+            values["shap_explanations"] = {**shap, "value_components": vc}
+
+    return values
+
+
+def _insert_values(values: dict) -> dict:
+    """Projection values with JSONB columns serialized to text for _PROJECTION_INSERT."""
+    return {
+        col: _jsonb_text(val) if col in _PROJECTION_JSONB_COLUMNS else val
+        for col, val in values.items()
+    }
+
+
+def _copy_record(values: dict) -> tuple:
+    """Order projection values for COPY, serializing JSONB columns to text.
+
+    None is written as JSON null, matching what the ORM stores for JSONB.
+    """
+    return tuple(
+        _jsonb_text(values[col]) if col in _PROJECTION_JSONB_COLUMNS else values[col]
+        for col in _PROJECTION_COLUMNS
+    )
+
+
+def _jsonb_text(val) -> str:
+    """Serialize a raw JSONB value to JSON text, with NaN/Infinity as null."""
+    if orjson is None:
+        return json.dumps(_sanitize_jsonb(val))
+    return orjson.dumps(
+        val,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        # Anything orjson can't handle natively gets the slow-path conversion
+        default=_sanitize_jsonb,
+    ).decode()
 
 
 def _sanitize_jsonb(val):
@@ -328,34 +442,25 @@ def _sanitize_jsonb(val):
     if val is None:
         return None
 
-    # Handle pandas NaN-like values
-    if isinstance(val, float):
-        if math.isnan(val) or math.isinf(val):
-            return None
-        return val
+    # Exact-type dispatch covers nearly every value; subclasses fall through below
+    handler = _JSONB_HANDLERS.get(type(val))
+    if handler is not None:
+        return handler(val)
 
-    # Handle numpy scalar types
-    try:
-        import numpy as np
-        if isinstance(val, (np.integer,)):
-            return int(val)
-        if isinstance(val, (np.floating,)):
-            f = float(val)
-            return None if math.isnan(f) or math.isinf(f) else f
-        if isinstance(val, np.bool_):
-            return bool(val)
-        if isinstance(val, np.ndarray):
-            return _sanitize_jsonb(val.tolist())
-    except ImportError:
-        pass
-
-    # Recurse into dicts
+    if isinstance(val, float):
+        return _finite_or_none(val)
+    if isinstance(val, np.integer):
+        return int(val)
+    if isinstance(val, np.floating):
+        return _finite_or_none(val)
+    if isinstance(val, np.bool_):
+        return bool(val)
+    if isinstance(val, np.ndarray):
+        return _sanitize_jsonb(val.tolist())
     if isinstance(val, dict):
-        return {k: _sanitize_jsonb(v) for k, v in val.items()}
-
-    # Recurse into lists
+        return _sanitize_dict(val)
     if isinstance(val, list):
-        return [_sanitize_jsonb(v) for v in val]
+        return _sanitize_list(val)
 
     # Strings, ints, bools pass through
     if isinstance(val, (str, int, bool)):
@@ -368,5 +473,40 @@ def _sanitize_jsonb(val):
         return None
 
 
+def _finite_or_none(val) -> float | None:
+    f = float(val)
+    return f if math.isfinite(f) else None
+
+
+def _sanitize_dict(val: dict) -> dict:
+    sanitize = _sanitize_jsonb
+    return {k: sanitize(v) for k, v in val.items()}
+
+
+def _sanitize_list(val: list) -> list:
+    sanitize = _sanitize_jsonb
+    return [sanitize(v) for v in val]
+
+
+def _passthrough(val):
+    return val
+
+
+_JSONB_HANDLERS = {
+    dict: _sanitize_dict,
+    list: _sanitize_list,
+    str: _passthrough,
+    int: _passthrough,
+    bool: _passthrough,
+    float: _finite_or_none,
+    np.float64: _finite_or_none,
+    np.float32: _finite_or_none,
+    np.int64: int,
+    np.int32: int,
+    np.bool_: bool,
+    np.ndarray: lambda arr: _sanitize_list(arr.tolist()),
+}
+
+
 if __name__ == "__main__":
     asyncio.run(main())
@@ -49,32 +49,43 @@ async def main():
     # Enable pybaseball cache
     fangraphs_fetcher.enable_cache()
 
-    # Step 1: Build player ID map
-    logger.info("Step 1: Building player ID map...")
-    id_map = player_id_mapper.build_player_id_map()
-    async with async_session_factory() as session:
-        count = await upsert_players_from_id_map(session, id_map)
-    logger.info(f"Step 1 complete: {count} players in database")
-
-    # Step 2: Fetch and load batting stats
-    logger.info("Step 2: Fetching batting stats from FanGraphs...")
-    raw_batting = fangraphs_fetcher.fetch_batting_stats(
-        settings.backfill_start_year, CURRENT_YEAR
-    )
-    cleaned_batting = clean_batting_stats(raw_batting)
-    async with async_session_factory() as session:
-        bat_count = await load_batting_seasons(session, cleaned_batting)
-    logger.info(f"Step 2 complete: {bat_count} batting season rows loaded")
-
-    # Step 3: Fetch and load pitching stats
-    logger.info("Step 3: Fetching pitching stats from FanGraphs...")
-    raw_pitching = fangraphs_fetcher.fetch_pitching_stats(
-        settings.backfill_start_year, CURRENT_YEAR
-    )
-    cleaned_pitching = clean_pitching_stats(raw_pitching)
-    async with async_session_factory() as session:
-        pit_count = await load_pitching_seasons(session, cleaned_pitching)
-    logger.info(f"Step 3 complete: {pit_count} pitching season rows loaded")
+    # FanGraphs fetches don't depend on the player table, so start both now and
+    # let the HTTP round-trips overlap the ID map build and the database loads
+    logger.info("Fetching batting and pitching stats from FanGraphs in the background...")
+    batting_fetch = asyncio.create_task(asyncio.to_thread(
+        fangraphs_fetcher.fetch_batting_stats, settings.backfill_start_year, CURRENT_YEAR
+    ))
+    pitching_fetch = asyncio.create_task(asyncio.to_thread(
+        fangraphs_fetcher.fetch_pitching_stats, settings.backfill_start_year, CURRENT_YEAR
+    ))
+
+    try:
+        # Step 1: Build player ID map
+        logger.info("Step 1: Building player ID map...")
+        id_map = await asyncio.to_thread(player_id_mapper.build_player_id_map)
+        async with async_session_factory() as session:
+            count = await upsert_players_from_id_map(session, id_map)
+        logger.info(f"Step 1 complete: {count} players in database")
+
+        # Step 2: Load batting stats
+        logger.info("Step 2: Loading batting stats...")
+        cleaned_batting = await asyncio.to_thread(clean_batting_stats, await batting_fetch)
+        async with async_session_factory() as session:
+            bat_count = await load_batting_seasons(session, cleaned_batting)
+        logger.info(f"Step 2 complete: {bat_count} batting season rows loaded")
+
+        # Step 3: Load pitching stats
+        logger.info("Step 3: Loading pitching stats...")
+        cleaned_pitching = await asyncio.to_thread(clean_pitching_stats, await pitching_fetch)
+        async with async_session_factory() as session:
+            pit_count = await load_pitching_seasons(session, cleaned_pitching)
+        logger.info(f"Step 3 complete: {pit_count} pitching season rows loaded")
+    except BaseException:
+        logger.exception("Seed failed; cancelling outstanding FanGraphs fetches")
+        for fetch in (batting_fetch, pitching_fetch):
+            fetch.cancel()
+        await asyncio.gather(batting_fetch, pitching_fetch, return_exceptions=True)
+        raise
 
     logger.info("=== Seed complete ===")
     logger.info(f"  Players: {count}")